@@ -1,59 +1,201 @@
+import heapq
+import math
+
 class AVLNode:
+    __slots__ = ("value", "left", "right", "height", "size")
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1  # Number of nodes in the subtree rooted here
 
 class AVLTree:
     def __init__(self):
         self.root = None
 
-    def insert(self, value):
-        self.root = self._insert_recursive(self.root, value)
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from sorted values in O(n)."""
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted requires values in non-decreasing order")
+        tree = cls()
+        tree.root = tree._build_balanced(values, 0, len(values) - 1)
+        return tree
 
-    def _insert_recursive(self, node, value):
-        if not node:
-            return AVLNode(value)
-        if value < node.value:
-            node.left = self._insert_recursive(node.left, value)
-        else:
-            node.right = self._insert_recursive(node.right, value)
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a balanced tree from values in any order."""
+        return cls.from_sorted(sorted(iterable))
 
+    def merge(self, other):
+        """Merge the values of another tree into this one in linear time."""
+        merged = list(heapq.merge(self, other))
+        self.root = self._build_balanced(merged, 0, len(merged) - 1)
+
+    def _build_balanced(self, values, low, high):
+        if low > high:
+            return None
+        mid = (low + high) >> 1
+        node = AVLNode(values[mid])
+        node.left = self._build_balanced(values, low, mid - 1)
+        node.right = self._build_balanced(values, mid + 1, high)
         node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
-        return self._balance(node)
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+        return node
 
-    def delete(self, value):
-        self.root = self._delete_recursive(self.root, value)
+    def insert(self, value):
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        new_node = AVLNode(value)
+        if not path:
+            self.root = new_node
+        elif value < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self._rebalance_path(path, 1)
 
-    def _delete_recursive(self, node, value):
+    def delete(self, value):
+        path = []
+        node = self.root
+        while node and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
         if not node:
-            return node
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
-            temp = self._min_value_node(node.right)
+            return
+        if node.left and node.right:
+            # Copy the inorder successor into the node, then unlink the successor instead
+            path.append(node)
+            temp = node.right
+            while temp.left:
+                path.append(temp)
+                temp = temp.left
             node.value = temp.value
-            node.right = self._delete_recursive(node.right, temp.value)
-        
-        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
-        return self._balance(node)
+            node = temp
+        self._replace_child(path[-1] if path else None, node, node.left or node.right)
+        self._rebalance_path(path, -1)
 
     def search(self, value):
-        return self._search_recursive(self.root, value)
+        node = self.root
+        while node and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
+
+    def _rebalance_path(self, path, delta):
+        """Walk the recorded root-to-leaf path bottom-up, fixing heights, sizes and rotating."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+            node.size += delta
+            subtree = self._balance(node)
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i else None, node, subtree)
+            # Once a subtree keeps its old height, no ancestor can change shape,
+            # but each one still gains or loses a node
+            if subtree.height == old_height:
+                for ancestor in path[:i]:
+                    ancestor.size += delta
+                return
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
 
-    def _search_recursive(self, node, value):
-        if not node or node.value == value:
-            return node
-        if value < node.value:
-            return self._search_recursive(node.left, value)
-        return self._search_recursive(node.right, value)
+    def __len__(self):
+        return self._get_size(self.root)
+
+    def select(self, k):
+        """Return the k-th smallest value (0-based) in O(log n)."""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, key):
+        """Return how many stored values are smaller than key in O(log n)."""
+        smaller = 0
+        node = self.root
+        while node:
+            if node.value < key:
+                smaller += self._get_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return smaller
+
+    def count_range(self, lo, hi):
+        """Return how many values v satisfy lo <= v < hi in O(log n)."""
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    def percentile(self, p):
+        """Return the nearest-rank p-th percentile (0 <= p <= 100) in O(log n)."""
+        if not 0 <= p <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        return self.select(max(0, math.ceil(p * len(self) / 100) - 1))
+
+    def __iter__(self):
+        """Yield the values in ascending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        """Yield the values in descending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def range(self, lo, hi):
+        """Yield the values v with lo <= v < hi in ascending order."""
+        stack = []
+        node = self.root
+        while True:
+            # Skip left subtrees that can only hold values below lo
+            while node:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
 
     def _balance(self, node):
         balance = self._get_balance(node)
@@ -78,6 +220,8 @@ class AVLTree:
         z.right = T2
         z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
         y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        y.size = z.size
+        z.size = 1 + self._get_size(z.left) + self._get_size(z.right)
         return y
 
     def _rotate_right(self, y):
@@ -87,6 +231,8 @@ class AVLTree:
         y.left = T2
         y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
         x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
+        x.size = y.size
+        y.size = 1 + self._get_size(y.left) + self._get_size(y.right)
         return x
 
     def _get_height(self, node):
@@ -94,15 +240,20 @@ class AVLTree:
             return 0
         return node.height
 
+    def _get_size(self, node):
+        if not node:
+            return 0
+        return node.size
+
     def _get_balance(self, node):
         if not node:
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
 
     def _min_value_node(self, node):
-        if node is None or node.left is None:
-            return node
-        return self._min_value_node(node.left)
+        while node is not None and node.left is not None:
+            node = node.left
+        return node
 
 # Utility function to print the tree in order (for debugging)
 def inorder_traversal(node, result):
@@ -170,9 +321,46 @@ def test_avl_tree():
         assert value not in result, f"Value {value} still present after deletion"
     print("Deletion test passed.")
 
+    # Test Bulk Load and Merge
+    print("Testing bulk load...")
+    bulk = AVLTree.from_iterable([8, 3, 12, 1, 6, 9, 14, 4])
+    assert check_avl_properties(bulk), "AVL property violated after bulk load"
+    bulk.merge(tree)
+    result = []
+    inorder_traversal(bulk.root, result)
+    assert check_avl_properties(bulk), "AVL property violated after merge"
+    assert result == sorted([8, 3, 12, 1, 6, 9, 14, 4, 30, 15, 25, 1]), "Inorder traversal is incorrect after merge."
+    print("Bulk load test passed.")
+
+    # Test Iterators on sorted input
+    print("Testing iterators...")
+    chain = AVLTree()
+    for value in range(5000):
+        chain.insert(value)
+    assert check_avl_properties(chain), "AVL property violated after sorted insertions"
+    assert list(chain) == list(range(5000)), "Iteration order is incorrect."
+    assert list(reversed(chain)) == list(range(4999, -1, -1)), "Reverse iteration order is incorrect."
+    assert list(chain.range(10, 15)) == [10, 11, 12, 13, 14], "Range iteration is incorrect."
+    print("Iterator test passed.")
+
+    # Test Order Statistics
+    print("Testing order statistics...")
+    stats = AVLTree()
+    for value in [50, 10, 40, 20, 30, 20, 60]:
+        stats.insert(value)
+    stats.delete(40)
+    ordered = [10, 20, 20, 30, 50, 60]
+    assert len(stats) == len(ordered), "Size is incorrect after insertions and deletions."
+    assert [stats.select(k) for k in range(len(ordered))] == ordered, "select is incorrect."
+    assert [stats.rank(v) for v in (5, 20, 25, 60, 70)] == [0, 1, 3, 5, 6], "rank is incorrect."
+    assert stats.count_range(20, 50) == 3, "count_range is incorrect."
+    assert stats.percentile(0) == 10 and stats.percentile(50) == 20 and stats.percentile(100) == 60, "percentile is incorrect."
+    print("Order statistics test passed.")
+
     # Final AVL Property Check
     assert check_avl_properties(tree), "AVL properties are violated in the final tree."
     print("All tests passed successfully, and AVL properties are intact.")
 
 # Run the tests
-test_avl_tree()
+if __name__ == "__main__":
+    test_avl_tree()
@@ -0,0 +1,44 @@
+import random
+import sys
+import time
+
+from avl import AVLTree
+from bst import BinarySearchTree
+from redblack import RedBlackTree
+
+
+def benchmark_bulk_load(tree_cls, sizes):
+    """Time repeated insert() against from_sorted() and merge() for each size."""
+    results = []
+    for n in sizes:
+        values = list(range(n))
+        random.shuffle(values)
+
+        start_time = time.time()
+        tree = tree_cls()
+        for value in values:
+            tree.insert(value)
+        insert_time = time.time() - start_time
+
+        start_time = time.time()
+        tree_cls.from_sorted(range(n))
+        bulk_time = time.time() - start_time
+
+        left = tree_cls.from_sorted(range(0, n, 2))
+        right = tree_cls.from_sorted(range(1, n, 2))
+        start_time = time.time()
+        left.merge(right)
+        merge_time = time.time() - start_time
+
+        results.append((n, insert_time, bulk_time, merge_time))
+    return results
+
+
+# Example usage: python benchmark_bulk_load.py 100000 1000000 10000000
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10**5]
+    for tree_cls in (BinarySearchTree, AVLTree, RedBlackTree):
+        print(tree_cls.__name__)
+        for n, insert_time, bulk_time, merge_time in benchmark_bulk_load(tree_cls, sizes):
+            print(f"  n={n:>9}  insert: {insert_time:8.3f}s  from_sorted: {bulk_time:8.3f}s  "
+                  f"merge: {merge_time:8.3f}s  speedup: {insert_time / bulk_time:6.1f}x")
@@ -0,0 +1,37 @@
+import gc
+import sys
+import tracemalloc
+
+from avl import AVLTree
+from bst import BinarySearchTree
+from compact_avl import CompactAVLTree
+from redblack import RedBlackTree
+
+
+def measure_memory(build, n):
+    """Return the bytes still allocated after build(n) returns its structure."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current
+
+
+def benchmark_memory(n):
+    builders = [
+        ("list of keys", lambda n: list(range(n))),
+        ("BinarySearchTree", lambda n: BinarySearchTree.from_sorted(range(n))),
+        ("AVLTree", lambda n: AVLTree.from_sorted(range(n))),
+        ("RedBlackTree", lambda n: RedBlackTree.from_sorted(range(n))),
+        ("CompactAVLTree", lambda n: CompactAVLTree.from_sorted(range(n))),
+    ]
+    return [(name, measure_memory(build, n)) for name, build in builders]
+
+
+# Example usage: python benchmark_memory.py 1000000
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    for name, size in benchmark_memory(n):
+        print(f"{name:>16}: {size / 2**20:8.1f} MiB  ({size / n:6.1f} bytes/key)")
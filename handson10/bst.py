@@ -1,4 +1,8 @@
+import heapq
+
 class Node:
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -8,49 +12,82 @@ class BinarySearchTree:
     def __init__(self):
         self.root = None
 
-    def insert(self, value):
-        self.root = self._insert_recursive(self.root, value)
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from sorted values in O(n)."""
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted requires values in non-decreasing order")
+        tree = cls()
+        tree.root = tree._build_balanced(values, 0, len(values) - 1)
+        return tree
 
-    def _insert_recursive(self, node, value):
-        if node is None:
-            return Node(value)
-        if value < node.value:
-            node.left = self._insert_recursive(node.left, value)
-        else:
-            node.right = self._insert_recursive(node.right, value)
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a balanced tree from values in any order."""
+        return cls.from_sorted(sorted(iterable))
+
+    def merge(self, other):
+        """Merge the values of another tree into this one in linear time."""
+        merged = list(heapq.merge(self, other))
+        self.root = self._build_balanced(merged, 0, len(merged) - 1)
+
+    def _build_balanced(self, values, low, high):
+        if low > high:
+            return None
+        mid = (low + high) >> 1
+        node = Node(values[mid])
+        node.left = self._build_balanced(values, low, mid - 1)
+        node.right = self._build_balanced(values, mid + 1, high)
         return node
 
-    def search(self, value):
-        return self._search_recursive(self.root, value)
+    def insert(self, value):
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node = node.left if value < node.value else node.right
+        new_node = Node(value)
+        if parent is None:
+            self.root = new_node
+        elif value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
 
-    def _search_recursive(self, node, value):
-        if node is None or node.value == value:
-            return node
-        if value < node.value:
-            return self._search_recursive(node.left, value)
-        return self._search_recursive(node.right, value)
+    def search(self, value):
+        node = self.root
+        while node is not None and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
 
     def delete(self, value):
-        self.root = self._delete_recursive(self.root, value)
-
-    def _delete_recursive(self, node, value):
+        parent = None
+        node = self.root
+        while node is not None and node.value != value:
+            parent = node
+            node = node.left if value < node.value else node.right
         if node is None:
-            return node
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
+            return
+        # Node with two children: Copy the inorder successor (smallest in the right subtree)
+        # into it, then unlink the successor, which has no left child
+        if node.left is not None and node.right is not None:
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+        # Node with only one child or no child
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            # Node with only one child or no child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            # Node with two children: Get the inorder successor (smallest in the right subtree)
-            temp = self._min_value_node(node.right)
-            node.value = temp.value
-            node.right = self._delete_recursive(node.right, temp.value)
-        return node
+            parent.right = child
 
     def _min_value_node(self, node):
         current = node
@@ -59,29 +96,82 @@ class BinarySearchTree:
         return current
 
     def inorder_traversal(self):
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-
-    def _inorder_recursive(self, node, result):
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
-bst = BinarySearchTree()
-values = [50, 30, 20, 40, 70, 60, 80]
-for val in values:
-    bst.insert(val)
-
-# Test search
-assert bst.search(30) is not None
-assert bst.search(100) is None
-
-# Test inorder traversal (should be sorted)
-assert bst.inorder_traversal() == [20, 30, 40, 50, 60, 70, 80]
-
-# Test deletion
-bst.delete(20)
-bst.delete(30)
-bst.delete(50)
-assert bst.inorder_traversal() == [40, 60, 70, 80]
+        return list(self)
+
+    def __iter__(self):
+        """Yield the values in ascending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        """Yield the values in descending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def range(self, lo, hi):
+        """Yield the values v with lo <= v < hi in ascending order."""
+        stack = []
+        node = self.root
+        while True:
+            # Skip left subtrees that can only hold values below lo
+            while node is not None:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
+
+if __name__ == "__main__":
+    bst = BinarySearchTree()
+    values = [50, 30, 20, 40, 70, 60, 80]
+    for val in values:
+        bst.insert(val)
+
+    # Test search
+    assert bst.search(30) is not None
+    assert bst.search(100) is None
+
+    # Test inorder traversal (should be sorted)
+    assert bst.inorder_traversal() == [20, 30, 40, 50, 60, 70, 80]
+
+    # Test deletion
+    bst.delete(20)
+    bst.delete(30)
+    bst.delete(50)
+    assert bst.inorder_traversal() == [40, 60, 70, 80]
+
+    # Test bulk load and merge
+    bulk = BinarySearchTree.from_iterable([5, 1, 9, 3])
+    bulk.merge(bst)
+    assert bulk.inorder_traversal() == [1, 3, 5, 9, 40, 60, 70, 80]
+
+    # Test iterators on sorted input, which degenerates into a long chain
+    chain = BinarySearchTree()
+    for val in range(5000):
+        chain.insert(val)
+    assert list(chain) == list(range(5000))
+    assert list(reversed(chain)) == list(range(4999, -1, -1))
+    assert list(chain.range(10, 15)) == [10, 11, 12, 13, 14]
+    chain.delete(4999)
+    assert chain.search(4999) is None and chain.search(4998) is not None
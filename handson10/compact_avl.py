@@ -0,0 +1,281 @@
+import heapq
+from array import array
+
+NIL = 0  # Slot 0 is a shared empty leaf with height 0
+
+
+class CompactAVLTree:
+    """AVL tree stored as parallel typed columns instead of node objects.
+
+    Node i is described by keys[i], left[i], right[i] and height[i]. Child links are
+    slot indexes into the int64 columns and heights fit in a byte, so a node costs
+    about 25 bytes. Keys must fit in a signed 64-bit integer.
+    """
+
+    def __init__(self):
+        self.keys = array("q", [0])
+        self.left = array("q", [NIL])
+        self.right = array("q", [NIL])
+        self.height = bytearray(1)
+        self.root = NIL
+        self._size = 0
+        self._free = NIL  # Head of the list of released slots, chained through left
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from sorted values in O(n)."""
+        tree = cls()
+        tree._load(array("q", iterable))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a balanced tree from values in any order."""
+        return cls.from_sorted(sorted(iterable))
+
+    def merge(self, other):
+        """Merge the values of another tree into this one in linear time."""
+        self._load(array("q", heapq.merge(self, other)))
+
+    def _load(self, values):
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted requires values in non-decreasing order")
+        # Sorted value i lives in slot i + 1, so only the links need computing
+        n = len(values)
+        self.keys = array("q", [0])
+        self.keys.extend(values)
+        self.left = array("q", [NIL]) * (n + 1)
+        self.right = array("q", [NIL]) * (n + 1)
+        self.height = bytearray(n + 1)
+        self._size = n
+        self._free = NIL
+        self.root = self._build_balanced(0, n - 1)
+
+    def _build_balanced(self, low, high):
+        if low > high:
+            return NIL
+        mid = (low + high) >> 1
+        i = mid + 1
+        self.left[i] = self._build_balanced(low, mid - 1)
+        self.right[i] = self._build_balanced(mid + 1, high)
+        self._update(i)
+        return i
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, value):
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        i = self.root
+        while i:
+            path.append(i)
+            i = left[i] if value < keys[i] else right[i]
+        new = self._new_node(value)
+        if not path:
+            self.root = new
+        elif value < keys[path[-1]]:
+            left[path[-1]] = new
+        else:
+            right[path[-1]] = new
+        self._size += 1
+        self._rebalance_path(path)
+
+    def delete(self, value):
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        i = self.root
+        while i and keys[i] != value:
+            path.append(i)
+            i = left[i] if value < keys[i] else right[i]
+        if not i:
+            return
+        if left[i] and right[i]:
+            # Copy the inorder successor into the slot, then unlink the successor instead
+            path.append(i)
+            temp = right[i]
+            while left[temp]:
+                path.append(temp)
+                temp = left[temp]
+            keys[i] = keys[temp]
+            i = temp
+        self._replace_child(path[-1] if path else NIL, i, left[i] or right[i])
+        self._release(i)
+        self._size -= 1
+        self._rebalance_path(path)
+
+    def search(self, value):
+        """Return the slot index holding value, or None if it is absent."""
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root
+        while i and keys[i] != value:
+            i = left[i] if value < keys[i] else right[i]
+        return i or None
+
+    def _new_node(self, value):
+        if self._free:
+            i = self._free
+            self._free = self.left[i]
+            self.keys[i] = value
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.height[i] = 1
+        else:
+            i = len(self.keys)
+            self.keys.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.height.append(1)
+        return i
+
+    def _release(self, i):
+        self.left[i] = self._free
+        self.right[i] = NIL
+        self.height[i] = 0
+        self._free = i
+
+    def _rebalance_path(self, path):
+        """Walk the recorded root-to-leaf path bottom-up, fixing heights and rotating."""
+        height = self.height
+        for p in range(len(path) - 1, -1, -1):
+            i = path[p]
+            old_height = height[i]
+            self._update(i)
+            subtree = self._balance(i)
+            if subtree != i:
+                self._replace_child(path[p - 1] if p else NIL, i, subtree)
+            # Once a subtree keeps its old height, no ancestor can change
+            if height[subtree] == old_height:
+                return
+
+    def _replace_child(self, parent, old, new):
+        if parent == NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _update(self, i):
+        self.height[i] = 1 + max(self.height[self.left[i]], self.height[self.right[i]])
+
+    def _get_balance(self, i):
+        return self.height[self.left[i]] - self.height[self.right[i]]
+
+    def _balance(self, i):
+        balance = self._get_balance(i)
+        if balance > 1:
+            if self._get_balance(self.left[i]) < 0:
+                self.left[i] = self._rotate_left(self.left[i])
+            return self._rotate_right(i)
+        if balance < -1:
+            if self._get_balance(self.right[i]) > 0:
+                self.right[i] = self._rotate_right(self.right[i])
+            return self._rotate_left(i)
+        return i
+
+    def _rotate_left(self, z):
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def _rotate_right(self, y):
+        x = self.left[y]
+        self.left[y] = self.right[x]
+        self.right[x] = y
+        self._update(y)
+        self._update(x)
+        return x
+
+    def __iter__(self):
+        """Yield the keys in ascending order using an explicit stack."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i:
+            while i:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield keys[i]
+            i = right[i]
+
+    def __reversed__(self):
+        """Yield the keys in descending order using an explicit stack."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i:
+            while i:
+                stack.append(i)
+                i = right[i]
+            i = stack.pop()
+            yield keys[i]
+            i = left[i]
+
+    def range(self, lo, hi):
+        """Yield the keys k with lo <= k < hi in ascending order."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        i = self.root
+        while True:
+            # Skip left subtrees that can only hold keys below lo
+            while i:
+                if keys[i] < lo:
+                    i = right[i]
+                else:
+                    stack.append(i)
+                    i = left[i]
+            if not stack:
+                return
+            i = stack.pop()
+            if not keys[i] < hi:
+                return
+            yield keys[i]
+            i = right[i]
+
+
+# Function to verify AVL Tree properties
+def check_compact_avl_properties(tree):
+    for i in range(1, len(tree.keys)):
+        if tree.height[i] == 0:
+            continue  # Released slot
+        left_height = tree.height[tree.left[i]]
+        right_height = tree.height[tree.right[i]]
+        if tree.height[i] != 1 + max(left_height, right_height) or abs(left_height - right_height) > 1:
+            print(f"AVL property violated at slot {i} with key {tree.keys[i]}")
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    tree = CompactAVLTree()
+    values = [10, 20, 30, 15, 25, 5, 1]
+    for value in values:
+        tree.insert(value)
+        assert check_compact_avl_properties(tree), f"AVL property violated after inserting {value}"
+    assert list(tree) == sorted(values)
+    assert all(tree.search(value) is not None for value in values)
+    assert tree.search(100) is None
+
+    for value in [10, 20, 5]:
+        tree.delete(value)
+        assert check_compact_avl_properties(tree), f"AVL property violated after deleting {value}"
+        assert tree.search(value) is None
+    assert list(tree) == [1, 15, 25, 30]
+
+    # Released slots are reused before the columns grow
+    slots = len(tree.keys)
+    tree.insert(7)
+    assert len(tree.keys) == slots
+
+    bulk = CompactAVLTree.from_sorted(range(1000))
+    assert check_compact_avl_properties(bulk)
+    bulk.merge(tree)
+    assert len(bulk) == 1005 and list(bulk) == sorted(list(range(1000)) + [1, 7, 15, 25, 30])
+    assert list(bulk.range(995, 1000)) == [995, 996, 997, 998, 999]
+    print("All tests passed successfully, and AVL properties are intact.")
@@ -1,16 +1,105 @@
+import heapq
+import math
+
 class RBNode:
+    __slots__ = ("value", "color", "left", "right", "parent", "size")
+
     def __init__(self, value, color="R"):
         self.value = value
         self.color = color  # "R" for Red, "B" for Black
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1  # Number of real nodes in the subtree rooted here
 
 class RedBlackTree:
     def __init__(self):
         self.TNULL = RBNode(0, color="B")  # Sentinel node for leaves
+        self.TNULL.size = 0
         self.root = self.TNULL
 
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from sorted values in O(n)."""
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted requires values in non-decreasing order")
+        tree = cls()
+        tree._load(values)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a balanced tree from values in any order."""
+        return cls.from_sorted(sorted(iterable))
+
+    def merge(self, other):
+        """Merge the values of another tree into this one in linear time."""
+        self._load(list(heapq.merge(self, other)))
+
+    def _load(self, values):
+        # A midpoint split leaves every leaf on the last two levels, so all
+        # nodes can be black except those on the deepest level, which are red.
+        red_depth = len(values).bit_length() - 1
+        self.root = self._build_balanced(values, 0, len(values) - 1, None, 0, red_depth)
+        self.root.color = "B"
+
+    def _build_balanced(self, values, low, high, parent, depth, red_depth):
+        if low > high:
+            return self.TNULL
+        mid = (low + high) >> 1
+        node = RBNode(values[mid], color="R" if depth == red_depth else "B")
+        node.parent = parent
+        node.left = self._build_balanced(values, low, mid - 1, node, depth + 1, red_depth)
+        node.right = self._build_balanced(values, mid + 1, high, node, depth + 1, red_depth)
+        node.size = 1 + node.left.size + node.right.size
+        return node
+
+    def __iter__(self):
+        """Yield the values in ascending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node != self.TNULL:
+            while node != self.TNULL:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        """Yield the values in descending order using an explicit stack."""
+        stack = []
+        node = self.root
+        while stack or node != self.TNULL:
+            while node != self.TNULL:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def range(self, lo, hi):
+        """Yield the values v with lo <= v < hi in ascending order."""
+        stack = []
+        node = self.root
+        while True:
+            # Skip left subtrees that can only hold values below lo
+            while node != self.TNULL:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
+
     def insert(self, value):
         new_node = RBNode(value)
         new_node.left = self.TNULL
@@ -22,6 +111,7 @@ class RedBlackTree:
         x = self.root
         while x != self.TNULL:
             y = x
+            x.size += 1  # The new node will land somewhere below x
             if new_node.value < x.value:
                 x = x.left
             else:
@@ -100,13 +190,16 @@ class RedBlackTree:
         y_original_color = y.color
         if z.left == self.TNULL:
             x = z.right
+            self._shrink_ancestors(z)
             self._rb_transplant(z, z.right)
         elif z.right == self.TNULL:
             x = z.left
+            self._shrink_ancestors(z)
             self._rb_transplant(z, z.left)
         else:
             y = self._minimum(z.right)
             y_original_color = y.color
+            self._shrink_ancestors(y)
             x = y.right
             if y.parent == z:
                 x.parent = y
@@ -118,9 +211,17 @@ class RedBlackTree:
             y.left = z.left
             y.left.parent = y
             y.color = z.color
+            y.size = z.size
         if y_original_color == "B":
             self._fix_delete(x)
 
+    def _shrink_ancestors(self, node):
+        """Remove one from the subtree size of every ancestor of node."""
+        node = node.parent
+        while node is not None:
+            node.size -= 1
+            node = node.parent
+
     def _rb_transplant(self, u, v):
         if u.parent == None:
             self.root = v
@@ -190,6 +291,8 @@ class RedBlackTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        y.size = x.size
+        x.size = 1 + x.left.size + x.right.size
 
     def _rotate_right(self, x):
         y = x.left
@@ -205,6 +308,48 @@ class RedBlackTree:
             x.parent.left = y
         y.right = x
         x.parent = y
+        y.size = x.size
+        x.size = 1 + x.left.size + x.right.size
+
+    def __len__(self):
+        return self.root.size
+
+    def select(self, k):
+        """Return the k-th smallest value (0-based) in O(log n)."""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, key):
+        """Return how many stored values are smaller than key in O(log n)."""
+        smaller = 0
+        node = self.root
+        while node != self.TNULL:
+            if node.value < key:
+                smaller += node.left.size + 1
+                node = node.right
+            else:
+                node = node.left
+        return smaller
+
+    def count_range(self, lo, hi):
+        """Return how many values v satisfy lo <= v < hi in O(log n)."""
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    def percentile(self, p):
+        """Return the nearest-rank p-th percentile (0 <= p <= 100) in O(log n)."""
+        if not 0 <= p <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        return self.select(max(0, math.ceil(p * len(self) / 100) - 1))
 
     def search(self, value):
         node = self.root
@@ -299,9 +444,48 @@ def test_red_black_tree():
         assert value not in result, f"Value {value} still present after deletion"
     print("Deletion test passed.")
 
+    # Test Bulk Load and Merge
+    print("Testing bulk load...")
+    for n in range(10):
+        bulk = RedBlackTree.from_sorted(range(n))
+        assert check_red_black_properties(bulk), f"Red-Black properties violated after bulk loading {n} values"
+    bulk = RedBlackTree.from_iterable([8, 3, 12, 1, 6, 9, 14, 4])
+    bulk.merge(tree)
+    result = []
+    inorder_traversal(bulk.root, result, bulk.TNULL)
+    assert check_red_black_properties(bulk), "Red-Black properties violated after merge"
+    assert result == sorted([8, 3, 12, 1, 6, 9, 14, 4, 30, 15, 25, 1]), "Inorder traversal is incorrect after merge."
+    bulk.insert(7)
+    bulk.delete(8)
+    assert check_red_black_properties(bulk), "Red-Black properties violated after updating a bulk-loaded tree"
+    print("Bulk load test passed.")
+
+    # Test Iterators
+    print("Testing iterators...")
+    values = list(bulk)
+    assert values == sorted(values), "Iteration order is incorrect."
+    assert list(reversed(bulk)) == values[::-1], "Reverse iteration order is incorrect."
+    assert list(bulk.range(4, 13)) == [v for v in values if 4 <= v < 13], "Range iteration is incorrect."
+    print("Iterator test passed.")
+
+    # Test Order Statistics
+    print("Testing order statistics...")
+    stats = RedBlackTree()
+    for value in [50, 10, 40, 20, 30, 20, 60]:
+        stats.insert(value)
+    stats.delete(40)
+    ordered = [10, 20, 20, 30, 50, 60]
+    assert len(stats) == len(ordered), "Size is incorrect after insertions and deletions."
+    assert [stats.select(k) for k in range(len(ordered))] == ordered, "select is incorrect."
+    assert [stats.rank(v) for v in (5, 20, 25, 60, 70)] == [0, 1, 3, 5, 6], "rank is incorrect."
+    assert stats.count_range(20, 50) == 3, "count_range is incorrect."
+    assert stats.percentile(0) == 10 and stats.percentile(50) == 20 and stats.percentile(100) == 60, "percentile is incorrect."
+    print("Order statistics test passed.")
+
     # Final Red-Black Property Check
     assert check_red_black_properties(tree), "Red-Black properties are violated in the final tree."
     print("All tests passed successfully, and Red-Black properties are intact.")
 
 # Run the tests
-test_red_black_tree()
+if __name__ == "__main__":
+    test_red_black_tree()
@@ -0,0 +1,68 @@
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+
+from dynamic_array import DynamicArray
+
+
+def measure(build):
+    """Return (values, traced bytes they retain) for a zero-argument build()."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, current
+
+
+def benchmark_dynamic_array(n):
+    source = array("q", range(n))
+
+    def append_list():
+        values = []
+        for i in range(n):
+            values.append(i * 3)
+        return values
+
+    def append_array():
+        values = DynamicArray()
+        for i in range(n):
+            values.append(i * 3)
+        return values
+
+    print(f"n={n}")
+    for name, build in (("list", append_list), ("DynamicArray", append_array)):
+        start_time = time.time()
+        build()
+        elapsed = time.time() - start_time
+        structure, size = measure(build)  # Timed separately, since tracing slows allocation
+        print(f"  {name:12s} append: {n / elapsed / 1e6:5.2f}M/s, {size / n:5.1f} bytes/item")
+        del structure
+
+    for growth_factor in (1.5, 2.0, 4.0):
+        values = DynamicArray(growth_factor=growth_factor)
+        reallocations = 0
+        capacity = values.capacity
+        for i in range(n):
+            values.append(i)
+            if values.capacity != capacity:
+                reallocations += 1
+                capacity = values.capacity
+        print(f"  growth_factor={growth_factor}: {reallocations} reallocations, "
+              f"{capacity / n:.2f}x capacity/size")
+
+    start_time = time.time()
+    values = list(source)
+    print(f"  list(array)                {(time.time() - start_time) * 1e3:8.2f}ms")
+    start_time = time.time()
+    values = DynamicArray()
+    values.extend(source)
+    print(f"  DynamicArray.extend(array) {(time.time() - start_time) * 1e3:8.2f}ms")
+
+
+# Example usage: python benchmark_dynamic_array.py 10000000
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    benchmark_dynamic_array(n)
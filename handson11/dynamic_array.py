@@ -0,0 +1,210 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only used by to_numpy()
+    np = None
+
+TYPECODES = {"q": 8, "d": 8}  # int64 and float64 items
+_FORMATS = {"q": ("q", "l"), "d": ("d",)}  # Buffer formats accepted by extend() without a loop
+
+
+class DynamicArray:
+    """Growable array of int64 ("q") or float64 ("d") values in one contiguous buffer.
+
+    The Python counterpart of DynamicArray.cpp: values are stored unboxed in a
+    bytearray and accessed through a memoryview cast to the item type. When
+    the array is full its capacity is multiplied by growth_factor, so appends
+    stay O(1) amortized for any factor above 1.
+
+    memoryview() (and, on Python 3.12+, memoryview(arr) itself) exports the
+    live elements without copying, so NumPy, struct and array.array can read
+    them in place. Slicing returns such a view too. Growing moves the data to
+    a new buffer; views taken before that keep the old contents.
+    """
+
+    def __init__(self, typecode="q", data=(), capacity=0, growth_factor=2.0):
+        if typecode not in TYPECODES:
+            raise ValueError(f"typecode must be one of {sorted(TYPECODES)}")
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        self.typecode = typecode
+        self.itemsize = TYPECODES[typecode]
+        self.growth_factor = growth_factor
+        self._size = 0
+        self._allocate(capacity)
+        self.extend(data)
+
+    def _allocate(self, capacity):
+        # A fresh buffer rather than an in-place resize, which a bytearray
+        # refuses while any memoryview of it is alive
+        buffer = bytearray(capacity * self.itemsize)
+        view = memoryview(buffer).cast(self.typecode)
+        if self._size:
+            view[:self._size] = self._view[:self._size]
+        self._buffer = buffer
+        self._view = view
+
+    @property
+    def capacity(self):
+        return len(self._view)
+
+    def reserve(self, capacity):
+        """Make room for at least capacity items without further reallocation."""
+        if capacity > self.capacity:
+            self._allocate(capacity)
+
+    def _grow(self, needed):
+        capacity = max(needed, int(self.capacity * self.growth_factor), self.capacity + 1)
+        self._allocate(capacity)
+
+    def shrink_to_fit(self):
+        """Release the unused capacity."""
+        if self.capacity != self._size:
+            self._allocate(self._size)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        if self._size == self.capacity:
+            self._grow(self._size + 1)
+        self._view[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        """Append values from an iterable or, without a Python-level loop, from a buffer.
+
+        Buffers of the same item type (array.array, NumPy arrays, memoryviews,
+        another DynamicArray) are copied with one slice assignment.
+        """
+        source = _as_view(values, self.typecode)
+        if source is None:
+            for value in values:
+                self.append(value)
+            return
+        n = len(source)
+        if self._size + n > self.capacity:
+            self._grow(self._size + n)
+        self._view[self._size:self._size + n] = source
+        self._size += n
+
+    def pop(self, index=-1):
+        """Remove and return the item at index (the last one by default)."""
+        if self._size == 0:
+            raise IndexError("pop from empty array")
+        index = self._index(index)
+        value = self._view[index]
+        self._view[index:self._size - 1] = self._view[index + 1:self._size]
+        self._size -= 1
+        return value
+
+    def clear(self):
+        """Remove every item but keep the capacity."""
+        self._size = 0
+
+    def _index(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view[:self._size][index]  # A view, not a copy
+        return self._view[self._index(index)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # Slice assignment cannot resize: value must have as many items as the slice
+            source = _as_view(value, self.typecode)
+            if source is None:
+                source = memoryview(array(self.typecode, value))
+            self._view[:self._size][index] = source
+            return
+        self._view[self._index(index)] = value
+
+    def __iter__(self):
+        return iter(self._view[:self._size])
+
+    def __eq__(self, other):
+        if isinstance(other, DynamicArray):
+            return self.tolist() == other.tolist()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"DynamicArray({self.typecode!r}, {self.tolist()})"
+
+    def memoryview(self):
+        """Return a zero-copy, writable view of the live items."""
+        return self._view[:self._size]
+
+    def __buffer__(self, flags):
+        # Buffer protocol for Python 3.12+, so memoryview(arr) and np.asarray(arr) work directly
+        return self.memoryview()
+
+    def tolist(self):
+        return self._view[:self._size].tolist()
+
+    def tobytes(self):
+        return self._view[:self._size].tobytes()
+
+    def tofile(self, f):
+        f.write(self._view[:self._size])
+
+    def nbytes(self):
+        """Return the bytes allocated for the buffer, including unused capacity."""
+        return len(self._buffer)
+
+    def to_numpy(self):
+        """Return a NumPy array that shares memory with the live items."""
+        if np is None:
+            raise ImportError("to_numpy() requires NumPy")
+        return np.frombuffer(self.memoryview(), dtype=np.int64 if self.typecode == "q" else np.float64)
+
+
+def _as_view(values, typecode):
+    """Return values as a flat memoryview of typecode items, or None if it is not such a buffer."""
+    if isinstance(values, DynamicArray):
+        values = values.memoryview()
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.ndim != 1 or not view.c_contiguous or view.itemsize != TYPECODES[typecode]:
+        return None
+    # NumPy reports int64 as "l" on platforms where a C long is 8 bytes
+    if view.format.lstrip("@=") not in _FORMATS[typecode]:
+        return None
+    return view.cast("B").cast(typecode)
+
+
+if __name__ == "__main__":
+    arr = DynamicArray()
+    for i in range(10):
+        arr.append(i)
+        print(f"Added: {i}, Size: {len(arr)}, Capacity: {arr.capacity}")
+    assert arr.tolist() == list(range(10)) and arr[-1] == 9
+    view = arr[2:5]
+    view[0] = 42  # Slices are views into the array
+    assert arr[2] == 42
+
+    arr.extend(array("q", [100, 200]))
+    assert arr.pop() == 200 and arr.pop(0) == 0 and len(arr) == 10
+    arr.shrink_to_fit()
+    assert arr.capacity == len(arr)
+
+    floats = DynamicArray("d", [0.5, 1.5], growth_factor=1.5)
+    floats.extend(x / 4 for x in range(5))
+    assert floats.tolist() == [0.5, 1.5, 0.0, 0.25, 0.5, 0.75, 1.0]
+
+    import struct
+    assert struct.unpack(f"{len(arr)}q", arr.memoryview()) == tuple(arr.tolist())
+    if np is not None:
+        shared = arr.to_numpy()
+        shared[0] = -1  # No copy: writes go straight to the array
+        assert arr[0] == -1
+        arr.extend(np.arange(3, dtype=np.int64))
+        assert arr.tolist()[-3:] == [0, 1, 2]
+    print("All DynamicArray tests passed.")
@@ -0,0 +1,68 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from csr_graph import CSRGraph
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson14"))
+from dijkstra import dijkstra  # noqa: E402
+
+
+def measure(build):
+    """Return (graph, bytes retained by it) for a zero-argument graph builder."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, current
+
+
+def benchmark_csr(num_vertices, num_edges):
+    def random_edges():
+        # Both representations build their own copy of the same seeded edges
+        rng = random.Random(42)
+        for _ in range(num_edges):
+            yield rng.randrange(num_vertices), rng.randrange(num_vertices), rng.random()
+
+    def build_dict():
+        graph = {u: [] for u in range(num_vertices)}
+        for u, v, weight in random_edges():
+            graph[u].append((v, weight))
+        return graph
+
+    graph, dict_bytes = measure(build_dict)
+    csr, csr_bytes = measure(lambda: CSRGraph.from_edges(num_vertices, random_edges()))
+    start_time = time.time()
+    CSRGraph.from_edges(num_vertices, random_edges())
+    build_time = time.time() - start_time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.csr")
+        csr.save(path)
+        start_time = time.time()
+        CSRGraph.load(path)
+        load_time = time.time() - start_time
+
+    start_time = time.time()
+    dijkstra(graph, 0)
+    dict_dijkstra = time.time() - start_time
+    start_time = time.time()
+    dijkstra(csr, 0)
+    csr_dijkstra = time.time() - start_time
+
+    print(f"V={num_vertices} E={num_edges}")
+    print(f"  dict of lists: {dict_bytes / num_edges:6.1f} bytes/edge")
+    print(f"  CSRGraph:      {csr_bytes / num_edges:6.1f} bytes/edge  (build {build_time:.2f}s, load {load_time:.3f}s)")
+    print(f"  dijkstra: dict {dict_dijkstra:.2f}s, CSRGraph {csr_dijkstra:.2f}s")
+
+
+# Example usage: python benchmark_csr.py 100000 1000000
+if __name__ == "__main__":
+    num_vertices = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    num_edges = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6
+    benchmark_csr(num_vertices, num_edges)
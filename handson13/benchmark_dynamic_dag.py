@@ -0,0 +1,56 @@
+import random
+import sys
+import time
+
+from dynamic_dag import DynamicDAG, is_topological
+from topological_sort import Graph
+
+
+def random_dag_edges(vertices, edges, locality):
+    """Edges that are acyclic under a hidden order close to creation order.
+
+    The hidden order shuffles the vertex ids inside windows of `locality`, the way
+    a build scheduler mostly adds dependencies on recently created tasks. Edges
+    that disagree with the current order therefore only span a small region,
+    which is the case Pearce-Kelly is designed for.
+    """
+    hidden = list(range(vertices))
+    for start in range(0, vertices, locality):
+        window = hidden[start:start + locality]
+        random.shuffle(window)
+        hidden[start:start + locality] = window
+    for _ in range(edges):
+        i = random.randrange(vertices - 1)
+        j = min(vertices - 1, i + 1 + int(random.expovariate(1 / locality)))
+        yield hidden[i], hidden[j]
+
+
+def benchmark_dynamic_dag(vertices, edges, locality=50):
+    edge_list = list(random_dag_edges(vertices, edges, locality))
+
+    dag = DynamicDAG(vertices)
+    start_time = time.time()
+    for u, v in edge_list:
+        dag.add_edge(u, v)
+    incremental = (time.time() - start_time) / edges
+    assert is_topological(dag)
+
+    # Cost of the alternative: recomputing the whole order after an insertion
+    g = Graph(vertices)
+    for u, v in edge_list:
+        g.add_edge(u, v)
+    start_time = time.time()
+    g.topological_sort()
+    recompute = time.time() - start_time
+
+    print(f"V={vertices} E={edges}")
+    print(f"  DynamicDAG.add_edge:          {incremental * 1e6:10.1f} us per edge (amortized)")
+    print(f"  topological_sort() recompute: {recompute * 1e6:10.1f} us per edge")
+    print(f"  speedup: {recompute / incremental:.0f}x")
+
+
+# Example usage: python benchmark_dynamic_dag.py 100000 200000
+if __name__ == "__main__":
+    vertices = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    edges = int(float(sys.argv[2])) if len(sys.argv) > 2 else 2 * 10**5
+    benchmark_dynamic_dag(vertices, edges)
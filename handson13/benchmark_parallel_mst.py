@@ -0,0 +1,36 @@
+import os
+import random
+import sys
+import time
+
+from kruskal import Graph
+from parallel_mst import parallel_boruvka
+
+
+def benchmark_parallel_mst(num_vertices, num_edges, worker_counts):
+    g = Graph(num_vertices)
+    for _ in range(num_edges):
+        g.add_edge(random.randrange(num_vertices), random.randrange(num_vertices), random.random())
+
+    start_time = time.time()
+    expected = g.kruskal()
+    kruskal_time = time.time() - start_time
+    expected_weight = sum(weight for _, _, weight in expected)
+
+    print(f"V={num_vertices} E={num_edges} ({os.cpu_count()} CPUs)")
+    print(f"  Graph.kruskal():           {kruskal_time:7.2f}s")
+    for workers in worker_counts:
+        start_time = time.time()
+        tree = parallel_boruvka(num_vertices, g.edges, workers=workers)
+        elapsed = time.time() - start_time
+        assert len(tree) == len(expected)
+        assert abs(sum(weight for _, _, weight in tree) - expected_weight) < 1e-6 * max(1.0, expected_weight)
+        print(f"  parallel_boruvka({workers:2d} workers): {elapsed:7.2f}s")
+
+
+# Example usage: python benchmark_parallel_mst.py 200000 2000000 1 2 4 8
+if __name__ == "__main__":
+    num_vertices = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    num_edges = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6
+    worker_counts = [int(arg) for arg in sys.argv[3:]] or [1, 2, 4]
+    benchmark_parallel_mst(num_vertices, num_edges, worker_counts)
@@ -0,0 +1,318 @@
+import ast
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only used by to_numpy()
+    np = None
+
+_HEADER = struct.Struct("<qqq")  # vertices, edges, weighted flag
+
+
+class CSRGraph:
+    """Directed graph stored in compressed sparse row form.
+
+    The out-edges of vertex i are targets[offsets[i]:offsets[i + 1]], with the
+    matching weights[...] when the graph is weighted. Offsets and targets are
+    int64 arrays and weights are float64, so an edge costs 8 or 16 bytes instead
+    of a boxed tuple in a per-vertex list.
+
+    Vertices are the indexes 0..V-1. When built from a dict keyed by other
+    labels (such as the 'A', 'B', ... graphs in handson14) the labels are kept
+    in `labels` and the mapping interface below speaks in labels, so
+    dijkstra(), bellman_ford() and floyd_warshall() run on a CSRGraph as-is.
+    """
+
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        if len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets must end with the number of edges")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights and targets must have the same length")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self._index = None if labels is None else {label: i for i, label in enumerate(labels)}
+
+    @classmethod
+    def from_edges(cls, num_vertices, edges, labels=None, weighted=None):
+        """Build a graph from (u, v) or (u, v, weight) tuples over vertices 0..num_vertices-1.
+
+        weighted defaults to the shape of the first edge; every edge must then
+        have that shape, or ValueError is raised. Edges are bucketed by source
+        with a counting sort in O(V + E), and each vertex keeps its out-edges in
+        input order.
+        """
+        sources = array("q")
+        destinations = array("q")
+        weights = array("d") if weighted else None
+        for edge in edges:
+            if weighted is None:
+                weighted = len(edge) == 3
+                if weighted:
+                    weights = array("d")
+            if len(edge) != (3 if weighted else 2):
+                raise ValueError(f"expected {'weighted' if weighted else 'unweighted'} edges, got {edge!r}")
+            sources.append(edge[0])
+            destinations.append(edge[1])
+            if weighted:
+                weights.append(edge[2])
+        return cls._from_arrays(num_vertices, sources, destinations, weights, labels)
+
+    @classmethod
+    def _from_arrays(cls, num_vertices, sources, destinations, weights, labels):
+        for column in (sources, destinations):
+            if column and not 0 <= min(column) <= max(column) < num_vertices:
+                raise ValueError(f"edge endpoints must be in 0..{num_vertices - 1}")
+        offsets = array("q", [0]) * (num_vertices + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(num_vertices):
+            offsets[i + 1] += offsets[i]
+        position = offsets[:-1]
+        targets = array("q", [0]) * len(destinations)
+        sorted_weights = None if weights is None else array("d", [0.0]) * len(weights)
+        for edge, u in enumerate(sources):
+            slot = position[u]
+            position[u] = slot + 1
+            targets[slot] = destinations[edge]
+            if weights is not None:
+                sorted_weights[slot] = weights[edge]
+        return cls(offsets, targets, sorted_weights, labels)
+
+    @classmethod
+    def from_adjacency(cls, adjacency, num_vertices=None, weighted=None):
+        """Build a graph from a dict of neighbor lists or of (neighbor, weight) lists.
+
+        With num_vertices the keys must be the integers 0..num_vertices-1, as in
+        the handson13 Graph classes. Otherwise keys may be any hashable labels;
+        neighbors that never appear as a key become extra vertices.
+
+        weighted says whether entries are (neighbor, weight) pairs. By default it
+        is inferred, which is only possible when entries are either all pairs or
+        all not; graphs whose labels are themselves pairs must pass it, since a
+        pair that is also a key could be either.
+        """
+        if weighted is None:
+            entries = [entry for neighbors in adjacency.values() for entry in neighbors]
+            pairs = sum(1 for entry in entries if isinstance(entry, tuple) and len(entry) == 2)
+            if 0 < pairs < len(entries):
+                raise ValueError("mix of (neighbor, weight) pairs and plain neighbors; pass weighted=")
+            weighted = pairs > 0
+            if weighted and any(entry in adjacency for entry in entries):
+                raise ValueError("pair entries are also vertex labels; pass weighted= to disambiguate")
+
+        def neighbor_of(entry):
+            if not weighted:
+                return entry
+            if not isinstance(entry, tuple) or len(entry) != 2:
+                raise ValueError(f"expected a (neighbor, weight) pair, got {entry!r}")
+            return entry[0]
+
+        labels = None
+        if num_vertices is None:
+            labels = list(adjacency)
+            seen = set(labels)
+            for neighbors in adjacency.values():
+                for entry in neighbors:
+                    neighbor = neighbor_of(entry)
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        labels.append(neighbor)
+            num_vertices = len(labels)
+        index = None if labels is None else {label: i for i, label in enumerate(labels)}
+
+        edges = []
+        for node, neighbors in adjacency.items():
+            u = node if index is None else index[node]
+            for entry in neighbors:
+                neighbor = neighbor_of(entry)
+                v = neighbor if index is None else index[neighbor]
+                edges.append((u, v, entry[1]) if weighted else (u, v))
+        return cls.from_edges(num_vertices, edges, labels, weighted)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build a graph from one of the handson13 Graph classes.
+
+        Adjacency-list graphs (dfs.py, topological_sort.py) keep their edges as
+        directed edges. The edge list of kruskal.py holds (weight, u, v) tuples of an
+        undirected graph; each edge is stored once, as u -> v.
+        """
+        if hasattr(graph, "edges"):
+            return cls.from_edges(graph.vertices, ((u, v, weight) for weight, u, v in graph.edges),
+                                  weighted=True)
+        return cls.from_adjacency(graph.graph, graph.vertices, weighted=False)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    def index(self, label):
+        """Return the vertex index of a label."""
+        return label if self._index is None else self._index[label]
+
+    def label(self, i):
+        """Return the label of a vertex index."""
+        return i if self.labels is None else self.labels[i]
+
+    def out_degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbors(self, i):
+        """Return the out-neighbor indexes of vertex i as an int64 array."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def weighted_neighbors(self, i):
+        """Return (neighbor index, weight) pairs for the out-edges of vertex i."""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def edge_sources(self):
+        """Return an int64 array holding the source vertex of every edge."""
+        sources = array("q")
+        for i in range(self.num_vertices):
+            sources.extend(array("q", [i]) * (self.offsets[i + 1] - self.offsets[i]))
+        return sources
+
+    def iter_edges(self):
+        """Yield (u, v, weight) index triples; weight is None for unweighted graphs."""
+        for u in range(self.num_vertices):
+            for slot in range(self.offsets[u], self.offsets[u + 1]):
+                yield u, self.targets[slot], None if self.weights is None else self.weights[slot]
+
+    def reverse(self):
+        """Return the transposed graph, with every edge u -> v turned into v -> u."""
+        return self._from_arrays(self.num_vertices, self.targets, self.edge_sources(),
+                                 self.weights, self.labels)
+
+    def nbytes(self):
+        """Return the bytes held by the offset, target and weight buffers."""
+        size = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            size += self.weights.itemsize * len(self.weights)
+        return size
+
+    def to_numpy(self):
+        """Return (offsets, targets, weights) as NumPy arrays that share memory with the graph."""
+        if np is None:
+            raise ImportError("to_numpy() requires NumPy")
+        weights = None if self.weights is None else np.frombuffer(_buffer(self.weights), dtype=np.float64)
+        return (np.frombuffer(_buffer(self.offsets), dtype=np.int64),
+                np.frombuffer(_buffer(self.targets), dtype=np.int64), weights)
+
+    def save(self, path):
+        """Write the graph to a binary file that load() reads back without parsing edges.
+
+        Labels are stored as their repr after the arrays, so they must be Python
+        literals (strings, numbers, tuples of them, ...) that ast.literal_eval
+        rebuilds as equal values; ValueError is raised otherwise.
+        """
+        trailer = b""
+        if self.labels is not None:
+            trailer = repr(list(self.labels)).encode()
+            try:
+                same = ast.literal_eval(trailer.decode()) == list(self.labels)
+            except (ValueError, SyntaxError):
+                same = False
+            if not same:
+                raise ValueError("labels must be Python literals to be saved")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(self.num_vertices, self.num_edges, self.weighted))
+            self.offsets.tofile(f)
+            self.targets.tofile(f)
+            if self.weights is not None:
+                self.weights.tofile(f)
+            f.write(trailer)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            num_vertices, num_edges, weighted = _HEADER.unpack(f.read(_HEADER.size))
+            offsets = array("q")
+            offsets.fromfile(f, num_vertices + 1)
+            targets = array("q")
+            targets.fromfile(f, num_edges)
+            weights = None
+            if weighted:
+                weights = array("d")
+                weights.fromfile(f, num_edges)
+            trailer = f.read()
+        return cls(offsets, targets, weights, ast.literal_eval(trailer.decode()) if trailer else None)
+
+    # Mapping interface in terms of labels, matching the dict graphs of handson14
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __iter__(self):
+        return iter(range(self.num_vertices) if self.labels is None else self.labels)
+
+    def keys(self):
+        return list(self)
+
+    def __contains__(self, label):
+        if self._index is None:
+            return isinstance(label, int) and 0 <= label < self.num_vertices
+        return label in self._index
+
+    def __getitem__(self, label):
+        """Return the out-edges of label as neighbor labels, or (neighbor, weight) pairs."""
+        i = self.index(label)
+        start, end = self.offsets[i], self.offsets[i + 1]
+        if self.labels is None:
+            neighbors = self.targets[start:end].tolist()
+        else:
+            neighbors = [self.labels[v] for v in self.targets[start:end]]
+        if self.weights is None:
+            return neighbors
+        return list(zip(neighbors, self.weights[start:end].tolist()))
+
+
+def _buffer(column):
+    """Return an object exposing column's buffer, e.g. for a handson11 DynamicArray column."""
+    return column.memoryview() if hasattr(column, "memoryview") else column
+
+
+if __name__ == "__main__":
+    graph = CSRGraph.from_adjacency({
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 6)],
+        'C': [('D', 3)],
+        'D': []
+    })
+    print("Vertices:", list(graph), "Edges:", graph.num_edges, "Bytes:", graph.nbytes())
+    assert graph['B'] == [('C', 2.0), ('D', 6.0)]
+    assert graph.reverse()['D'] == [('B', 6.0), ('C', 3.0)]
+
+    unweighted = CSRGraph.from_edges(4, [(0, 1), (0, 2), (1, 2), (2, 0), (2, 3), (3, 3)])
+    assert [unweighted[v] for v in range(4)] == [[1, 2], [2], [0, 3], [3]]
+    assert sorted(unweighted.edge_sources()) == [0, 0, 1, 2, 2, 3]
+
+    grid = CSRGraph.from_adjacency({(0, 0): [(0, 1)], (0, 1): []}, weighted=False)
+    assert list(grid) == [(0, 0), (0, 1)] and grid[(0, 0)] == [(0, 1)]
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grid.csr")
+        grid.save(path)
+        assert list(CSRGraph.load(path)) == [(0, 0), (0, 1)] and CSRGraph.load(path)[(0, 0)] == [(0, 1)]
+    try:
+        CSRGraph.from_edges(2, [(0, 2)])
+        assert False, "out-of-range vertex not rejected"
+    except ValueError as error:
+        print("Rejected:", error)
+    try:
+        CSRGraph.from_adjacency({(0, 0): [(0, 1)], (0, 1): []})
+        assert False, "ambiguous adjacency not rejected"
+    except ValueError as error:
+        print("Rejected:", error)
@@ -8,17 +8,58 @@ class Graph:
     def add_edge(self, u, v):
         self.graph[u].append(v)
 
-    def dfs_util(self, v, visited):
-        visited[v] = True
-        print(v, end=" ")
+    @classmethod
+    def from_csr(cls, csr):
+        """Run this class's algorithms directly on a CSRGraph instead of a defaultdict."""
+        g = cls(csr.num_vertices)
+        g.graph = csr
+        return g
+
+    def iter_dfs(self, start, visited=None, order="pre", on_enter=None, on_exit=None):
+        """Lazily yield the vertices reachable from start in depth-first order.
+
+        An explicit stack of (vertex, neighbor iterator) pairs replaces recursion,
+        so graphs with long chains do not hit the recursion limit, and vertices are
+        visited in the same order as the recursive version. order="pre" yields a
+        vertex when it is first reached and order="post" once all its descendants
+        are finished; on_enter(v) and on_exit(v) are called at those two moments.
+        """
+        if order not in ("pre", "post"):
+            raise ValueError("order must be 'pre' or 'post'")
+        if visited is None:
+            visited = [False] * self.vertices
+        preorder = order == "pre"
 
-        for neighbor in self.graph[v]:
-            if not visited[neighbor]:
-                self.dfs_util(neighbor, visited)
+        visited[start] = True
+        if on_enter:
+            on_enter(start)
+        if preorder:
+            yield start
+        stack = [(start, iter(self.graph[start]))]
+        while stack:
+            v, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    if on_enter:
+                        on_enter(neighbor)
+                    if preorder:
+                        yield neighbor
+                    stack.append((neighbor, iter(self.graph[neighbor])))
+                    break
+            else:
+                stack.pop()
+                if on_exit:
+                    on_exit(v)
+                if not preorder:
+                    yield v
+
+    def dfs_util(self, v, visited):
+        return list(self.iter_dfs(v, visited))
 
     def dfs(self, start):
         visited = [False] * self.vertices
-        self.dfs_util(start, visited)
+        return self.dfs_util(start, visited)
 if __name__ == "__main__":
     g = Graph(4)
     g.add_edge(0, 1)
@@ -29,4 +70,11 @@ if __name__ == "__main__":
     g.add_edge(3, 3)
 
     print("DFS starting from vertex 2:")
-    g.dfs(2)
+    print(*g.dfs(2))
+    assert list(g.iter_dfs(2, order="post")) == [1, 0, 3, 2]
+
+    # A 100000-vertex chain is far deeper than the recursion limit
+    chain = Graph(100000)
+    for v in range(99999):
+        chain.add_edge(v, v + 1)
+    assert chain.dfs(0) == list(range(100000))
@@ -0,0 +1,76 @@
+from array import array
+
+
+class DisjointSet:
+    """Union-find over the elements 0..n-1, stored in two int64 arrays.
+
+    find() uses path halving, so every lookup also shortens the path it walks,
+    and union() hangs the smaller tree under the larger one. Together they give
+    near-constant amortized time per operation without any recursion.
+    """
+
+    def __init__(self, n):
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self.components = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self):
+        """Add a new singleton element and return it."""
+        x = len(self.parent)
+        self.parent.append(x)
+        self.size.append(1)
+        self.components += 1
+        return x
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # Path halving: skip to the grandparent
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Merge the sets holding x and y; return False if they were already joined."""
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.components -= 1
+        return True
+
+    def union_many(self, pairs):
+        """Union every (x, y) pair and return how many merges actually happened."""
+        return sum(self.union(x, y) for x, y in pairs)
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def connected_many(self, pairs):
+        """Answer connected() for every (x, y) pair."""
+        return [self.find(x) == self.find(y) for x, y in pairs]
+
+    def set_size(self, x):
+        """Return the number of elements in the set holding x."""
+        return self.size[self.find(x)]
+
+
+if __name__ == "__main__":
+    ds = DisjointSet(10)
+    assert ds.union_many([(0, 1), (2, 3), (1, 3), (0, 2)]) == 3
+    assert ds.connected(0, 3) and not ds.connected(0, 4)
+    assert ds.connected_many([(1, 2), (4, 5)]) == [True, False]
+    assert ds.components == 7 and ds.set_size(2) == 4
+
+    # A long chain of unions stays shallow and never recurses
+    chain = DisjointSet(100000)
+    for i in range(99999):
+        chain.union(i, i + 1)
+    assert chain.components == 1 and chain.connected(0, 99999)
+    print("All disjoint set tests passed.")
@@ -0,0 +1,132 @@
+from array import array
+
+
+class DynamicDAG:
+    """Directed acyclic graph that keeps a topological order up to date as edges arrive.
+
+    Uses the Pearce-Kelly online algorithm. Inserting u -> v costs nothing when u
+    already comes before v. Otherwise only the vertices whose positions lie between
+    v and u are searched: those reachable from v and those that reach u are
+    swapped into the positions they already occupy, so the rest of the order
+    is untouched. An edge that would close a cycle is rejected with ValueError
+    and leaves the graph unchanged.
+    """
+
+    def __init__(self, vertices=0):
+        self.successors = [set() for _ in range(vertices)]
+        self.predecessors = [set() for _ in range(vertices)]
+        self.order = array("q", range(vertices))  # position -> vertex
+        self.position = array("q", range(vertices))  # vertex -> position
+
+    @property
+    def vertices(self):
+        return len(self.order)
+
+    def add_vertex(self):
+        """Add a vertex at the end of the order and return its id."""
+        v = len(self.order)
+        self.successors.append(set())
+        self.predecessors.append(set())
+        self.order.append(v)
+        self.position.append(v)
+        return v
+
+    def add_edge(self, u, v):
+        if u == v:
+            raise ValueError(f"edge {u} -> {v} would create a cycle")
+        if v in self.successors[u]:
+            return
+        lower = self.position[v]
+        upper = self.position[u]
+        if lower < upper:
+            forward = self._search(v, self.successors, lambda w: self.position[w] <= upper, u)
+            backward = self._search(u, self.predecessors, lambda w: self.position[w] > lower, None)
+            self._reorder(forward, backward)
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+
+    def topological_order(self):
+        """Return a read-only view of the current order in O(1); it tracks later inserts."""
+        return OrderView(self.order)
+
+    def _search(self, start, adjacency, in_region, target):
+        """Collect the vertices reachable from start inside the affected region."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            w = stack.pop()
+            for x in adjacency[w]:
+                if x == target:
+                    raise ValueError(f"edge {target} -> {start} would create a cycle")
+                if x not in seen and in_region(x):
+                    seen.add(x)
+                    stack.append(x)
+        return seen
+
+    def _reorder(self, forward, backward):
+        # Vertices that reach u must precede those reachable from v; both groups
+        # keep their relative order and reuse the same set of positions
+        position = self.position
+        moved = sorted(backward, key=position.__getitem__) + sorted(forward, key=position.__getitem__)
+        slots = sorted(position[w] for w in moved)
+        for w, slot in zip(moved, slots):
+            self.order[slot] = w
+            position[w] = slot
+
+
+class OrderView:
+    """Read-only sequence over a DynamicDAG's order array.
+
+    Unlike a memoryview it holds no buffer export, so the DAG can keep
+    appending vertices while views are alive.
+    """
+
+    __slots__ = ("_order",)
+
+    def __init__(self, order):
+        self._order = order
+
+    def __len__(self):
+        return len(self._order)
+
+    def __getitem__(self, index):
+        return self._order[index]
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __repr__(self):
+        return f"OrderView({self._order.tolist()})"
+
+
+def is_topological(dag):
+    """Check that every edge of dag goes forward in its current order."""
+    return all(dag.position[u] < dag.position[v]
+               for u in range(dag.vertices) for v in dag.successors[u])
+
+
+if __name__ == "__main__":
+    dag = DynamicDAG(6)
+    for u, v in [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]:
+        dag.add_edge(u, v)
+        assert is_topological(dag)
+    print("Topological order:", list(dag.topological_order()))
+
+    try:
+        dag.add_edge(1, 5)
+        assert False, "cycle not detected"
+    except ValueError as error:
+        print("Rejected:", error)
+    assert is_topological(dag) and 5 not in dag.successors[1]
+
+    import random
+    dag = DynamicDAG(200)
+    hidden = list(range(200))
+    random.shuffle(hidden)
+    rank = {v: i for i, v in enumerate(hidden)}
+    for _ in range(2000):
+        a, b = random.sample(range(200), 2)
+        if rank[a] > rank[b]:
+            a, b = b, a
+        dag.add_edge(a, b)
+    assert is_topological(dag)
@@ -1,3 +1,16 @@
+import heapq
+import os
+import sys
+import tempfile
+
+from disjoint_set import DisjointSet
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson6"))
+from external_sort import external_sort, read_records, write_records  # noqa: E402
+
+EDGE_FORMAT = "<dqq"  # (weight, u, v) records of an edge file
+
+
 class Graph:
     def __init__(self, vertices):
         self.vertices = vertices
@@ -6,42 +19,81 @@ class Graph:
     def add_edge(self, u, v, weight):
         self.edges.append((weight, u, v))
 
-    def find(self, parent, i):
-        if parent[i] == i:
-            return i
-        return self.find(parent, parent[i])
+    def kruskal(self):
+        # Heapify a copy instead of sorting self.edges: O(E) to build, and the
+        # loop usually stops long before every edge has been popped
+        heap = list(self.edges)
+        heapq.heapify(heap)
+        return kruskal_stream(self.vertices, _drain(heap))
 
-    def union(self, parent, rank, x, y):
-        root_x = self.find(parent, x)
-        root_y = self.find(parent, y)
 
-        if rank[root_x] < rank[root_y]:
-            parent[root_x] = root_y
-        elif rank[root_x] > rank[root_y]:
-            parent[root_y] = root_x
-        else:
-            parent[root_y] = root_x
-            rank[root_x] += 1
+def _drain(heap):
+    while heap:
+        yield heapq.heappop(heap)
 
-    def kruskal(self):
-        self.edges.sort()
-        parent = []
-        rank = []
 
-        for node in range(self.vertices):
-            parent.append(node)
-            rank.append(0)
+def kruskal_stream(num_vertices, sorted_edges):
+    """Kruskal's algorithm over (weight, u, v) edges that arrive in non-decreasing weight order.
+
+    Only the DisjointSet is held in memory, so the edges can come from a
+    generator or a file. Consumption stops as soon as the tree has
+    num_vertices - 1 edges; a ValueError is raised if the weights go down.
+    """
+    components = DisjointSet(num_vertices)
+    mst = []
+    if num_vertices <= 1:
+        return mst
+    last_weight = None
+    for weight, u, v in sorted_edges:
+        if last_weight is not None and weight < last_weight:
+            raise ValueError("edges are not sorted by weight")
+        last_weight = weight
+        if components.union(u, v):
+            mst.append((u, v, weight))
+            if len(mst) >= num_vertices - 1:
+                break
+    return mst
+
+
+def write_edge_file(path, edges):
+    """Write (weight, u, v) edges as fixed-size binary records for kruskal_file()."""
+    write_records(path, edges, EDGE_FORMAT)
+
+
+def kruskal_file(num_vertices, path, presorted=False, memory_limit=64 << 20, tmp_dir=None):
+    """Kruskal's algorithm over an edge file written by write_edge_file().
+
+    Unless presorted is set the file is first sorted with the external merge
+    sort of handson6 within memory_limit bytes, so graphs with far more edges
+    than fit in RAM only ever keep one read buffer and the DisjointSet resident.
+    """
+    if presorted:
+        return kruskal_stream(num_vertices, read_records(path, EDGE_FORMAT))
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        sorted_path = os.path.join(tmp, "edges.sorted")
+        external_sort(path, sorted_path, memory_limit, EDGE_FORMAT, tmp_dir=tmp)
+        return kruskal_stream(num_vertices, read_records(sorted_path, EDGE_FORMAT))
 
-        mst = []
-        for weight, u, v in self.edges:
-            root_u = self.find(parent, u)
-            root_v = self.find(parent, v)
 
-            if root_u != root_v:
-                mst.append((u, v, weight))
-                self.union(parent, rank, root_u, root_v)
+def kruskal_csr(csr):
+    """Kruskal's algorithm on a weighted CSRGraph, sorting edge indexes instead of edge tuples."""
+    sources = csr.edge_sources()
+    targets = csr.targets
+    weights = csr.weights
+    components = DisjointSet(csr.num_vertices)
 
+    mst = []
+    if csr.num_vertices <= 1:
         return mst
+    for edge in sorted(range(csr.num_edges), key=weights.__getitem__):
+        if components.union(sources[edge], targets[edge]):
+            mst.append((csr.label(sources[edge]), csr.label(targets[edge]), weights[edge]))
+            if len(mst) >= csr.num_vertices - 1:
+                break
+
+    return mst
+
+
 if __name__ == "__main__":
     g = Graph(4)
     g.add_edge(0, 1, 10)
@@ -54,3 +106,11 @@ if __name__ == "__main__":
     print("Edges in the Minimum Spanning Tree:")
     for u, v, weight in mst:
         print(f"{u} -- {v} == {weight}")
+
+    # Same MST from a presorted stream and from an unsorted edge file
+    edges = [(10, 0, 1), (6, 0, 2), (5, 0, 3), (15, 1, 3), (4, 2, 3)]
+    assert kruskal_stream(4, sorted(edges)) == mst
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "edges.bin")
+        write_edge_file(path, edges)
+        assert kruskal_file(4, path) == [(u, v, float(w)) for u, v, w in mst]
@@ -0,0 +1,158 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from disjoint_set import DisjointSet
+
+_TYPECODES = ("q", "q", "d", "q")  # sources, targets, weights, component of each vertex
+_shared = None  # (segments, views) attached by each worker process
+
+
+def _scan(sources, targets, weights, comp, start, end):
+    """Find the cheapest edge leaving every component among edges start..end-1.
+
+    Edges whose endpoints already share a component are dropped by compacting
+    the live ones to the front of the range, keeping their relative order. Ties
+    are broken by position, which therefore stays consistent with the original
+    edge order across rounds. Returns (new end, {component: (weight, position)}).
+    """
+    best = {}
+    get = best.get
+    write = start
+    for edge in range(start, end):
+        u = sources[edge]
+        v = targets[edge]
+        cu = comp[u]
+        cv = comp[v]
+        if cu == cv:
+            continue
+        weight = weights[edge]
+        if write != edge:
+            sources[write] = u
+            targets[write] = v
+            weights[write] = weight
+        current = get(cu)
+        if current is None or weight < current[0]:
+            best[cu] = (weight, write)
+        current = get(cv)
+        if current is None or weight < current[0]:
+            best[cv] = (weight, write)
+        write += 1
+    return write, best
+
+
+def _attach(names):
+    """Worker initializer: map the shared edge and component arrays once per process."""
+    global _shared
+    segments = [shared_memory.SharedMemory(name=name) for name in names]
+    _shared = segments, [shm.buf.cast(code) for shm, code in zip(segments, _TYPECODES)]
+
+
+def _scan_range(start, end):
+    return _scan(*_shared[1], start, end)
+
+
+def parallel_boruvka(num_vertices, edges, workers=None):
+    """Minimum spanning forest of an undirected graph with Borůvka's algorithm.
+
+    edges holds (weight, u, v) tuples, as in kruskal.Graph.edges. They are copied
+    once into shared memory as int64/float64 columns, and each round the process
+    pool scans disjoint slices of them for the cheapest edge out of every
+    component. The parent merges those candidates, joins the components with a
+    DisjointSet and publishes the new component ids. Each round at least halves
+    the number of components, so there are at most log2(V) rounds, and edges
+    found to be internal are compacted away by the workers as they go.
+
+    Returns the chosen (u, v, weight) edges, like Graph.kruskal().
+    """
+    columns = [array(code) for code in _TYPECODES[:3]]
+    for weight, u, v in edges:
+        columns[0].append(u)
+        columns[1].append(v)
+        columns[2].append(weight)
+    columns.append(array("q", range(num_vertices)))
+    num_edges = len(columns[0])
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or num_edges < 2 * workers:
+        return _boruvka(num_vertices, columns, [(0, num_edges)], None)
+
+    segments = []
+    views = []
+    try:
+        for column in columns:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(column) * column.itemsize))
+            segments.append(shm)
+            view = shm.buf.cast(column.typecode)
+            views.append(view)
+            view[:len(column)] = column
+        ranges = [(i * num_edges // workers, (i + 1) * num_edges // workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=([shm.name for shm in segments],)) as pool:
+            return _boruvka(num_vertices, views, ranges, pool)
+    finally:
+        for view in views:
+            view.release()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _boruvka(num_vertices, columns, ranges, pool):
+    sources, targets, weights, comp = columns
+    components = DisjointSet(num_vertices)
+    members = [[x] for x in range(num_vertices)]  # Vertices of each component, by its current id
+    mst = []
+    while len(mst) < num_vertices - 1:
+        if pool is None:
+            results = [_scan(sources, targets, weights, comp, start, end) for start, end in ranges]
+        else:
+            results = list(pool.map(_scan_range, [start for start, _ in ranges], [end for _, end in ranges]))
+
+        cheapest = {}
+        for c, candidate in (item for _, best in results for item in best.items()):
+            if c not in cheapest or candidate < cheapest[c]:
+                cheapest[c] = candidate
+        if not cheapest:
+            break  # The remaining components are not connected to each other
+
+        merged = set()
+        for weight, edge in cheapest.values():
+            u = sources[edge]
+            v = targets[edge]
+            if components.union(u, v):  # Two components may pick the same edge
+                mst.append((u, v, weight))
+                merged.add(comp[u])
+                merged.add(comp[v])
+        # Relabel only the vertices of components that were absorbed this round.
+        # Union by size keeps the larger side's id, so a vertex moves O(log V) times
+        for old in merged:
+            new = components.find(old)
+            if new != old:
+                for x in members[old]:
+                    comp[x] = new
+                members[new].extend(members[old])
+                members[old] = None
+        ranges = [(start, end) for (start, _), (end, _) in zip(ranges, results)]
+    return mst
+
+
+if __name__ == "__main__":
+    import random
+
+    from kruskal import Graph
+
+    def total(tree):
+        return sum(weight for _, _, weight in tree)
+
+    for workers in (1, 3):
+        for _ in range(20):
+            n = random.randint(1, 60)
+            g = Graph(n)
+            for _ in range(random.randint(0, 300)):
+                g.add_edge(random.randrange(n), random.randrange(n), random.randint(1, 20))
+            expected = g.kruskal()
+            tree = parallel_boruvka(n, g.edges, workers=workers)
+            assert len(tree) == len(expected) and total(tree) == total(expected)
+    print("All parallel Boruvka tests passed.")
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 
 class Graph:
     def __init__(self, vertices):
@@ -8,14 +8,34 @@ class Graph:
     def add_edge(self, u, v):
         self.graph[u].append(v)
 
+    @classmethod
+    def from_csr(cls, csr):
+        """Run this class's algorithms directly on a CSRGraph instead of a defaultdict."""
+        g = cls(csr.num_vertices)
+        g.graph = csr
+        return g
+
     def topological_sort_util(self, v, visited, stack):
+        # Explicit stack of (vertex, neighbor iterator) pairs instead of recursion;
+        # a vertex is appended once all of its descendants have been appended
         visited[v] = True
-        for neighbor in self.graph[v]:
-            if not visited[neighbor]:
-                self.topological_sort_util(neighbor, visited, stack)
-        stack.append(v)
+        path = [(v, iter(self.graph[v]))]
+        while path:
+            u, neighbors = path[-1]
+            for neighbor in neighbors:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    path.append((neighbor, iter(self.graph[neighbor])))
+                    break
+            else:
+                path.pop()
+                stack.append(u)
 
-    def topological_sort(self):
+    def topological_sort(self, method="dfs"):
+        if method == "kahn":
+            return list(self.iter_kahn())
+        if method != "dfs":
+            raise ValueError("method must be 'dfs' or 'kahn'")
         visited = [False] * self.vertices
         stack = []
 
@@ -25,6 +45,58 @@ class Graph:
 
         return stack[::-1]  # Reverse the stack for the correct order
 
+    def _in_degrees(self):
+        in_degree = [0] * self.vertices
+        for u in range(self.vertices):
+            for v in self.graph[u]:
+                in_degree[v] += 1
+        return in_degree
+
+    def iter_kahn(self):
+        """Lazily yield a topological order with Kahn's algorithm.
+
+        Raises ValueError once no vertex is left without an unprocessed
+        predecessor, which happens exactly when the graph has a cycle.
+        """
+        in_degree = self._in_degrees()
+        ready = deque(v for v in range(self.vertices) if in_degree[v] == 0)
+        emitted = 0
+        while ready:
+            u = ready.popleft()
+            emitted += 1
+            yield u
+            for v in self.graph[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    ready.append(v)
+        if emitted != self.vertices:
+            raise ValueError("graph has a cycle; no topological order exists")
+
+    def topological_waves(self):
+        """Group the vertices into waves that can each run concurrently.
+
+        Wave 0 holds the vertices with no predecessors and wave i + 1 the vertices
+        whose last predecessor is in wave i, so every edge goes from an earlier
+        wave to a later one. Raises ValueError if the graph has a cycle.
+        """
+        in_degree = self._in_degrees()
+        wave = [v for v in range(self.vertices) if in_degree[v] == 0]
+        waves = []
+        emitted = 0
+        while wave:
+            waves.append(wave)
+            emitted += len(wave)
+            next_wave = []
+            for u in wave:
+                for v in self.graph[u]:
+                    in_degree[v] -= 1
+                    if in_degree[v] == 0:
+                        next_wave.append(v)
+            wave = next_wave
+        if emitted != self.vertices:
+            raise ValueError("graph has a cycle; no topological order exists")
+        return waves
+
 if __name__ == "__main__":
     g = Graph(6)
     g.add_edge(5, 2)
@@ -36,3 +108,19 @@ if __name__ == "__main__":
 
     result = g.topological_sort()
     print("Topological Sort:", result)
+    print("Kahn's Algorithm:", g.topological_sort(method="kahn"))
+    print("Waves:", g.topological_waves())
+
+    # A cycle is reported instead of producing an invalid order
+    g.add_edge(1, 5)
+    try:
+        g.topological_sort(method="kahn")
+        assert False, "cycle not detected"
+    except ValueError:
+        print("Cycle detected.")
+
+    # A 100000-vertex chain is far deeper than the recursion limit
+    chain = Graph(100000)
+    for v in range(99999):
+        chain.add_edge(v, v + 1)
+    assert chain.topological_sort() == list(range(100000))
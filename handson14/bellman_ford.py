@@ -1,24 +1,179 @@
-def bellman_ford(graph, source):
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only used by method="numpy"
+    np = None
+
+
+class NegativeCycleError(ValueError):
+    """Raised when a negative weight cycle is reachable from the source.
+
+    cycle lists the nodes of one such cycle in edge order; the last node has an
+    edge back to the first.
+    """
+
+    def __init__(self, cycle):
+        super().__init__("Negative weight cycle detected: " + " -> ".join(map(str, cycle + cycle[:1])))
+        self.cycle = cycle
+
+
+def bellman_ford(graph, source, method="passes"):
+    """Return the shortest distances from source, or raise NegativeCycleError.
+
+    method selects the engine:
+
+    - "passes": relaxes every edge once per pass, stopping early as soon as a
+      pass changes nothing instead of always running |V| - 1 passes.
+    - "spfa": only re-scans the out-edges of nodes whose distance changed, kept
+      in a FIFO queue. Often far fewer relaxations on sparse graphs.
+    - "numpy": relaxes all edges of a pass at once on edge arrays with
+      np.minimum.at. Best for large sparse graphs where most passes touch
+      many nodes.
+    """
+    if method == "passes":
+        return _relax_passes(graph, source)[0]
+    if method == "spfa":
+        return _spfa(graph, source)[0]
+    if method == "numpy":
+        return _relax_numpy(graph, source)
+    raise ValueError(f"unknown method {method!r}")
+
+def _relax_passes(graph, source):
     distances = {node: float('inf') for node in graph}
     distances[source] = 0
+    predecessors = {source: None}
 
     for _ in range(len(graph) - 1):
+        changed = False
         for node in graph:
+            distance = distances[node]
+            if distance == float('inf'):
+                continue
             for neighbor, weight in graph[node]:
-                if distances[node] + weight < distances[neighbor]:
-                    distances[neighbor] = distances[node] + weight
+                if distance + weight < distances[neighbor]:
+                    distances[neighbor] = distance + weight
+                    predecessors[neighbor] = node
+                    changed = True
+        if not changed:
+            return distances, predecessors
 
     for node in graph:
         for neighbor, weight in graph[node]:
             if distances[node] + weight < distances[neighbor]:
-                return "Negative weight cycle detected."
+                predecessors[neighbor] = node
+                raise NegativeCycleError(_find_cycle(predecessors, neighbor) or _negative_cycle(graph, source))
+
+    return distances, predecessors
+
+def _spfa(graph, source):
+    distances = {node: float('inf') for node in graph}
+    distances[source] = 0
+    predecessors = {source: None}
+    edges_on_path = {source: 0}  # A shortest path never needs |V| or more edges
+    queue = deque([source])
+    queued = {source}
+
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        distance = distances[node]
+        for neighbor, weight in graph[node]:
+            if distance + weight < distances[neighbor]:
+                distances[neighbor] = distance + weight
+                predecessors[neighbor] = node
+                edges_on_path[neighbor] = edges_on_path[node] + 1
+                if edges_on_path[neighbor] >= len(graph):
+                    cycle = _find_cycle(predecessors, neighbor)
+                    raise NegativeCycleError(cycle or _negative_cycle(graph, source))
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return distances, predecessors
+
+def _relax_numpy(graph, source):
+    if np is None:
+        raise ImportError("method='numpy' requires NumPy")
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    sources, targets, weights = [], [], []
+    for node in nodes:
+        for neighbor, weight in graph[node]:
+            sources.append(index[node])
+            targets.append(index[neighbor])
+            weights.append(weight)
+    sources = np.array(sources, dtype=np.int64)
+    targets = np.array(targets, dtype=np.int64)
+    weights = np.array(weights, dtype=np.float64)
+
+    distances = np.full(len(nodes), np.inf)
+    distances[index[source]] = 0
+    predecessors = np.full(len(nodes), -1, dtype=np.int64)
+    for _ in range(len(nodes) - 1):
+        if not len(_relax_pass(distances, predecessors, sources, targets, weights)):
+            break
+    else:
+        improved = _relax_pass(distances, predecessors, sources, targets, weights)
+        if len(improved):
+            # A node that still improves in pass |V| leads back into a negative cycle
+            links = {i: (p if p >= 0 else None) for i, p in enumerate(predecessors.tolist())}
+            cycle = _find_cycle(links, int(improved[0]))
+            raise NegativeCycleError([nodes[i] for i in cycle] if cycle else _negative_cycle(graph, source))
+
+    return dict(zip(nodes, distances.tolist()))
 
-    return distances
+def _relax_pass(distances, predecessors, sources, targets, weights):
+    """Relax every edge against the previous pass's distances; return the improved node indexes."""
+    candidates = distances[sources] + weights
+    relaxed = distances.copy()
+    np.minimum.at(relaxed, targets, candidates)
+    improved = relaxed < distances
+    # Record, for each improved node, an edge that achieves its new distance
+    winners = improved[targets] & (candidates == relaxed[targets])
+    predecessors[targets[winners]] = sources[winners]
+    distances[:] = relaxed
+    return np.flatnonzero(improved)
+
+def _negative_cycle(graph, source):
+    """Find a negative cycle reachable from source with the dict engine."""
+    try:
+        _relax_passes(graph, source)
+    except NegativeCycleError as error:
+        return error.cycle
+    raise AssertionError("no negative cycle found")
+
+def _find_cycle(predecessors, start):
+    """Return a cycle of the predecessor graph reached by walking back from start, or None."""
+    seen = set()
+    node = start
+    while node is not None and node not in seen:
+        seen.add(node)
+        node = predecessors.get(node)
+    if node is None:
+        return None
+    cycle = [node]
+    current = predecessors[node]
+    while current != node:
+        cycle.append(current)
+        current = predecessors[current]
+    cycle.reverse()
+    return cycle
 
 # Example Usage
-graph = {
-    'A': [('B', 1)],
-    'B': [('C', 2)],
-    'C': [('A', -6)]
-}
-print(bellman_ford(graph, 'A'))
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1)],
+        'B': [('C', 2)],
+        'C': [('A', -6)]
+    }
+    try:
+        print(bellman_ford(graph, 'A'))
+    except NegativeCycleError as error:
+        print(error)
+        assert sorted(error.cycle) == ['A', 'B', 'C']
+
+    graph['C'] = [('A', -2), ('D', -1)]
+    graph['D'] = []
+    for method in ("passes", "spfa", "numpy" if np is not None else "spfa"):
+        assert bellman_ford(graph, 'A', method=method) == {'A': 0, 'B': 1, 'C': 3, 'D': 2}
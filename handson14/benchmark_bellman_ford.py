@@ -0,0 +1,43 @@
+import random
+import sys
+import time
+
+from bellman_ford import bellman_ford
+
+
+def random_potential_graph(num_nodes, num_edges):
+    """Sparse graph with negative weights but no negative cycles.
+
+    Each weight is a non-negative base plus p[u] - p[v] for random potentials p,
+    so every cycle keeps the non-negative total of its base weights, as in an
+    exchange-rate graph without arbitrage.
+    """
+    potential = [random.uniform(0, 100) for _ in range(num_nodes)]
+    graph = {u: [] for u in range(num_nodes)}
+    for u in range(num_nodes - 1):  # A path keeps every node reachable from 0
+        graph[u].append((u + 1, random.random() + potential[u] - potential[u + 1]))
+    for _ in range(num_edges - (num_nodes - 1)):
+        u, v = random.randrange(num_nodes), random.randrange(num_nodes)
+        graph[u].append((v, random.uniform(0, 10) + potential[u] - potential[v]))
+    return graph
+
+
+def benchmark_bellman_ford(num_nodes, num_edges):
+    graph = random_potential_graph(num_nodes, num_edges)
+    print(f"V={num_nodes} E={num_edges}")
+    expected = None
+    for method in ("passes", "spfa", "numpy"):
+        start_time = time.time()
+        distances = bellman_ford(graph, 0, method=method)
+        elapsed = time.time() - start_time
+        if expected is None:
+            expected = distances
+        assert all(abs(distances[node] - expected[node]) < 1e-6 for node in graph)
+        print(f"  bellman_ford(method={method!r:9s}): {elapsed:7.2f}s")
+
+
+# Example usage: python benchmark_bellman_ford.py 100000 500000
+if __name__ == "__main__":
+    num_nodes = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    num_edges = int(float(sys.argv[2])) if len(sys.argv) > 2 else 5 * 10**5
+    benchmark_bellman_ford(num_nodes, num_edges)
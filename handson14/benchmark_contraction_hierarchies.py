@@ -0,0 +1,58 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmark_shortest_path import grid_graph
+from contraction_hierarchies import ContractionHierarchy
+from dijkstra import shortest_path
+
+
+def highway_grid_graph(side, spacing=10):
+    """Grid in which every spacing-th row and column is four times faster, like arterial roads."""
+    graph = grid_graph(side)
+    for (x, y), edges in graph.items():
+        graph[(x, y)] = [((nx, ny), weight / 4 if (nx == x and x % spacing == 0) or (ny == y and y % spacing == 0)
+                          else weight) for (nx, ny), weight in edges]
+    return graph
+
+
+def benchmark_contraction_hierarchies(name, graph, queries):
+    num_edges = sum(len(edges) for edges in graph.values())
+
+    start_time = time.time()
+    ch = ContractionHierarchy.build(graph)
+    build_time = time.time() - start_time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.ch")
+        ch.save(path)
+        size = os.path.getsize(path)
+        start_time = time.time()
+        ch = ContractionHierarchy.load(path)
+        load_time = time.time() - start_time
+
+    cells = list(graph)
+    pairs = [(random.choice(cells), random.choice(cells)) for _ in range(queries)]
+    start_time = time.time()
+    expected = [shortest_path(graph, s, t)[0] for s, t in pairs]
+    dijkstra_time = time.time() - start_time
+    start_time = time.time()
+    distances = [ch.distance(s, t) for s, t in pairs]
+    ch_time = time.time() - start_time
+    assert all(abs(a - b) < 1e-9 for a, b in zip(distances, expected))
+
+    print(f"{name}: {len(graph)} nodes, {num_edges} edges")
+    print(f"  preprocessing: {build_time:.1f}s, {ch.num_shortcuts} shortcuts, "
+          f"{size / 2**20:.1f} MiB on disk (load {load_time:.2f}s)")
+    print(f"  shortest_path (dijkstra, early exit): {dijkstra_time / queries * 1e3:8.2f} ms/query")
+    print(f"  ContractionHierarchy.distance:        {ch_time / queries * 1e3:8.2f} ms/query")
+
+
+# Example usage: python benchmark_contraction_hierarchies.py 100 1000
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 70
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    benchmark_contraction_hierarchies(f"{side}x{side} uniform grid", grid_graph(side), queries)
+    benchmark_contraction_hierarchies(f"{side}x{side} grid with highways", highway_grid_graph(side), queries)
@@ -0,0 +1,31 @@
+import random
+import sys
+import time
+
+from floyd_warshall import floyd_warshall, floyd_warshall_matrix
+
+
+def random_graph(num_nodes, out_degree=8):
+    nodes = range(num_nodes)
+    return {u: [(v, random.random()) for v in random.sample(nodes, out_degree)] for u in nodes}
+
+
+def benchmark_floyd_warshall(dict_nodes, matrix_nodes):
+    graph = random_graph(dict_nodes)
+    start_time = time.time()
+    floyd_warshall(graph)
+    print(f"floyd_warshall (dicts), {dict_nodes} nodes: {time.time() - start_time:.2f}s")
+
+    graph = random_graph(matrix_nodes)
+    for options in ({}, {"dtype": "float32"}, {"block_size": 64}, {"block_size": 256}):
+        start_time = time.time()
+        floyd_warshall_matrix(graph, **options)
+        label = ", ".join(f"{key}={value}" for key, value in options.items()) or "float64"
+        print(f"floyd_warshall_matrix ({label}), {matrix_nodes} nodes: {time.time() - start_time:.2f}s")
+
+
+# Example usage: python benchmark_floyd_warshall.py 200 1000
+if __name__ == "__main__":
+    dict_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    matrix_nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    benchmark_floyd_warshall(dict_nodes, matrix_nodes)
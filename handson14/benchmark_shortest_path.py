@@ -0,0 +1,56 @@
+import random
+import sys
+import time
+
+from dijkstra import dijkstra, reverse_graph, shortest_path
+
+
+def grid_graph(side):
+    """Road-like grid: each cell links to its 4 neighbors with weights of at least 1."""
+    graph = {}
+    for x in range(side):
+        for y in range(side):
+            edges = []
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < side and 0 <= ny < side:
+                    edges.append(((nx, ny), 1 + random.random()))
+            graph[(x, y)] = edges
+    return graph
+
+
+def manhattan(node, target):
+    # Every edge costs at least 1, so the grid distance never overestimates
+    return abs(node[0] - target[0]) + abs(node[1] - target[1])
+
+
+def benchmark_shortest_path(side, queries):
+    graph = grid_graph(side)
+    reverse = reverse_graph(graph)
+    cells = list(graph)
+    pairs = [(random.choice(cells), random.choice(cells)) for _ in range(queries)]
+
+    start_time = time.time()
+    expected = [dijkstra(graph, s)[t] for s, t in pairs]
+    full_time = time.time() - start_time
+    print(f"{side}x{side} grid, {queries} random queries")
+    print(f"  {'dijkstra (full)':30s}{full_time / queries * 1e3:8.1f} ms/query, {len(graph):8d} settled")
+
+    for method, options in (("dijkstra", {}), ("bidirectional", {"reverse": reverse}),
+                            ("astar", {"heuristic": manhattan})):
+        settled = 0
+        start_time = time.time()
+        for (s, t), distance in zip(pairs, expected):
+            stats = {}
+            result, _ = shortest_path(graph, s, t, method=method, stats=stats, **options)
+            assert abs(result - distance) < 1e-9
+            settled += stats["settled"]
+        elapsed = time.time() - start_time
+        label = f"shortest_path({method})"
+        print(f"  {label:30s}{elapsed / queries * 1e3:8.1f} ms/query, {settled / queries:8.0f} settled")
+
+
+# Example usage: python benchmark_shortest_path.py 300 50
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    benchmark_shortest_path(side, queries)
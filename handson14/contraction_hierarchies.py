@@ -0,0 +1,339 @@
+import ast
+import heapq
+import struct
+from array import array
+
+_HEADER = struct.Struct("<qqqq")  # nodes, up edges, down edges, shortcuts
+
+
+class ContractionHierarchy:
+    """Shortest-path index for a static directed graph with non-negative weights.
+
+    Preprocessing contracts the nodes one at a time in order of importance.
+    Removing node v adds a shortcut u -> w of weight d(u, v) + d(v, w) for each
+    pair of neighbors whose shortest path ran through v, unless a witness search
+    finds another path that is no longer. A query then runs a bidirectional
+    Dijkstra in which both sides only climb towards more important nodes, so it
+    settles a few hundred nodes where plain Dijkstra settles most of the graph.
+
+    up[i] holds the edges i -> j and down[i] the edges j -> i with rank[j] > rank[i].
+    middle maps a shortcut (i, j) to the node it bypasses, for path unpacking.
+    """
+
+    def __init__(self, labels, rank, up, down, middle):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.middle = middle
+
+    @classmethod
+    def build(cls, graph, settle_limit=50):
+        """Contract every node of graph, a dict of (neighbor, weight) lists like dijkstra() takes.
+
+        settle_limit bounds each witness search. A lower limit speeds up
+        preprocessing but may add shortcuts that were not needed; query results
+        stay exact either way.
+        """
+        if settle_limit < 1:
+            raise ValueError("settle_limit must be at least 1")
+        labels = list(graph.keys())
+        index = {label: i for i, label in enumerate(labels)}
+        for node in list(labels):
+            for neighbor, _ in graph[node]:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+        n = len(labels)
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for node in graph.keys():
+            u = index[node]
+            for neighbor, weight in graph[node]:
+                if weight < 0:
+                    raise ValueError("contraction hierarchies need non-negative weights")
+                v = index[neighbor]
+                if u != v and weight < out_edges[u].get(v, float('inf')):
+                    out_edges[u][v] = weight
+                    in_edges[v][u] = weight
+
+        builder = _Contractor(out_edges, in_edges, settle_limit)
+        rank = [0] * n
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+        middle = {}
+        queue = [(builder.simulate(v)[0], v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: priorities of the remaining nodes drift as neighbors are contracted
+            priority, shortcuts = builder.simulate(v)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, v))
+                continue
+            rank[v] = order
+            order += 1
+            up[v] = list(out_edges[v].items())
+            down[v] = list(in_edges[v].items())
+            for u, w in builder.contract(v, shortcuts):
+                middle[(u, w)] = v
+        return cls(labels, rank, up, down, middle)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def num_shortcuts(self):
+        return len(self.middle)
+
+    def distance(self, source, target):
+        """Return the shortest distance from source to target, or inf if unreachable."""
+        return self._query(self.index[source], self.index[target])[0]
+
+    def shortest_path(self, source, target):
+        """Return (distance, path) like dijkstra.shortest_path(), with shortcuts unpacked."""
+        distance, meeting, parents = self._query(self.index[source], self.index[target])
+        if meeting is None:
+            return distance, []
+        # Climb back from the meeting node on both sides, then expand every shortcut
+        hops = []
+        node = meeting
+        while parents[0][node] is not None:
+            hops.append((parents[0][node], node))
+            node = parents[0][node]
+        hops.reverse()
+        node = meeting
+        while parents[1][node] is not None:
+            hops.append((node, parents[1][node]))
+            node = parents[1][node]
+        path = [self.labels[self.index[source]]]
+        for edge in hops:
+            stack = [edge]
+            while stack:
+                u, w = stack.pop()
+                v = self.middle.get((u, w))
+                if v is None:
+                    path.append(self.labels[w])
+                else:
+                    stack.append((v, w))
+                    stack.append((u, v))
+        return distance, path
+
+    def _query(self, s, t):
+        adjacency = (self.up, self.down)
+        distances = ({s: 0}, {t: 0})
+        parents = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        best, meeting = (0, s) if s == t else (float('inf'), None)
+        while queues[0] or queues[1]:
+            # Each side may stop once its smallest key can no longer beat best
+            for side in (0, 1):
+                queue = queues[side]
+                if queue and queue[0][0] >= best:
+                    queue.clear()
+            side = 0 if queues[0] and (not queues[1] or queues[0][0] <= queues[1][0]) else 1
+            if not queues[side]:
+                break
+            distance, node = heapq.heappop(queues[side])
+            if distance > distances[side][node]:
+                continue
+            other = distances[1 - side].get(node)
+            if other is not None and distance + other < best:
+                best, meeting = distance + other, node
+            # Stall-on-demand: a higher node already offers a shorter way to node,
+            # so node cannot lie on the shortest path and need not be expanded
+            reached = distances[side]
+            if any(reached.get(higher, float('inf')) + weight < distance
+                   for higher, weight in adjacency[1 - side][node]):
+                continue
+            for neighbor, weight in adjacency[side][node]:
+                candidate = distance + weight
+                if candidate < distances[side].get(neighbor, float('inf')):
+                    distances[side][neighbor] = candidate
+                    parents[side][neighbor] = node
+                    heapq.heappush(queues[side], (candidate, neighbor))
+        return best, meeting, parents
+
+    def save(self, path):
+        """Write the hierarchy as flat int64/float64 arrays, like CSRGraph.save() in handson13.
+
+        Weights are stored as float64. Labels follow the arrays as their repr,
+        so they must be Python literals that ast.literal_eval rebuilds as equal
+        values; ValueError is raised otherwise.
+        """
+        trailer = repr(self.labels)
+        try:
+            same = ast.literal_eval(trailer) == self.labels
+        except (ValueError, SyntaxError):
+            same = False
+        if not same:
+            raise ValueError("labels must be Python literals to be saved")
+        up = _flatten(self.up)
+        down = _flatten(self.down)
+        shortcuts = array("q")
+        for (u, w), v in self.middle.items():
+            shortcuts.extend((u, w, v))
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(len(self.labels), len(up[1]), len(down[1]), len(self.middle)))
+            array("q", self.rank).tofile(f)
+            for column in (*up, *down, shortcuts):
+                column.tofile(f)
+            f.write(trailer.encode())
+
+    @classmethod
+    def load(cls, path):
+        """Read a hierarchy written by save(); nothing in the file is executed."""
+        with open(path, "rb") as f:
+            n, num_up, num_down, num_shortcuts = _HEADER.unpack(f.read(_HEADER.size))
+            rank = _read(f, "q", n)
+            up = _unflatten(_read(f, "q", n + 1), _read(f, "q", num_up), _read(f, "d", num_up))
+            down = _unflatten(_read(f, "q", n + 1), _read(f, "q", num_down), _read(f, "d", num_down))
+            shortcuts = _read(f, "q", 3 * num_shortcuts)
+            labels = ast.literal_eval(f.read().decode())
+        middle = {(shortcuts[i], shortcuts[i + 1]): shortcuts[i + 2] for i in range(0, len(shortcuts), 3)}
+        return cls(labels, rank.tolist(), up, down, middle)
+
+
+def _flatten(adjacency):
+    """Return (offsets, targets, weights) arrays for a list of (neighbor, weight) lists."""
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("d")
+    for edges in adjacency:
+        for target, weight in edges:
+            targets.append(target)
+            weights.append(weight)
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+def _unflatten(offsets, targets, weights):
+    return [list(zip(targets[offsets[i]:offsets[i + 1]], weights[offsets[i]:offsets[i + 1]]))
+            for i in range(len(offsets) - 1)]
+
+
+def _read(f, typecode, count):
+    column = array(typecode)
+    column.fromfile(f, count)
+    return column
+
+
+class _Contractor:
+    """Mutable overlay graph used while contracting nodes."""
+
+    def __init__(self, out_edges, in_edges, settle_limit):
+        self.out_edges = out_edges
+        self.in_edges = in_edges
+        self.settle_limit = settle_limit
+        self.deleted_neighbors = [0] * len(out_edges)
+        self.level = [0] * len(out_edges)
+
+    def simulate(self, v):
+        """Return (priority, shortcuts) for contracting v now, without changing the graph.
+
+        The priority is twice the edge difference (shortcuts added minus edges
+        removed), plus the number of contracted neighbors and the depth of v in
+        the hierarchy so far; the last two keep the contraction spread evenly,
+        which keeps the upward searches of queries small.
+        """
+        shortcuts = self._shortcuts(v)
+        edge_difference = len(shortcuts) - len(self.in_edges[v]) - len(self.out_edges[v])
+        return 2 * edge_difference + self.deleted_neighbors[v] + self.level[v], shortcuts
+
+    def contract(self, v, shortcuts):
+        """Remove v from the overlay graph and insert the shortcuts (u, w, weight) it needs.
+
+        A shortcut is skipped when u -> w already has an edge at most as short.
+        Return the (u, w) pairs that were inserted.
+        """
+        for u in self.in_edges[v]:
+            del self.out_edges[u][v]
+            self.deleted_neighbors[u] += 1
+            self.level[u] = max(self.level[u], self.level[v] + 1)
+        for w in self.out_edges[v]:
+            del self.in_edges[w][v]
+            self.deleted_neighbors[w] += 1
+            self.level[w] = max(self.level[w], self.level[v] + 1)
+        inserted = []
+        for u, w, weight in shortcuts:
+            if weight < self.out_edges[u].get(w, float('inf')):
+                self.out_edges[u][w] = weight
+                self.in_edges[w][u] = weight
+                inserted.append((u, w))
+        return inserted
+
+    def _shortcuts(self, v):
+        shortcuts = []
+        targets = self.out_edges[v]
+        for u, to_v in self.in_edges[v].items():
+            limit = max((to_v + weight for w, weight in targets.items() if w != u), default=None)
+            if limit is None:
+                continue
+            witness = self._witness_search(u, v, limit)
+            for w, weight in targets.items():
+                if w != u and witness.get(w, float('inf')) > to_v + weight:
+                    shortcuts.append((u, w, to_v + weight))
+        return shortcuts
+
+    def _witness_search(self, source, excluded, limit):
+        """Bounded Dijkstra from source that avoids the node being contracted."""
+        distances = {source: 0}
+        queue = [(0, source)]
+        settled = 0
+        while queue and settled < self.settle_limit:
+            distance, node = heapq.heappop(queue)
+            if distance > distances[node]:
+                continue
+            if distance > limit:
+                break
+            settled += 1
+            for neighbor, weight in self.out_edges[node].items():
+                candidate = distance + weight
+                if neighbor != excluded and candidate < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = candidate
+                    heapq.heappush(queue, (candidate, neighbor))
+        return distances
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    from dijkstra import dijkstra
+
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 6)],
+        'C': [('D', 3)],
+        'D': []
+    }
+    ch = ContractionHierarchy.build(graph)
+    print("A -> D:", ch.shortest_path('A', 'D'), "shortcuts:", ch.num_shortcuts)
+    try:
+        ContractionHierarchy.build(graph, settle_limit=0)
+        assert False, "settle_limit=0 not rejected"
+    except ValueError as error:
+        print("Rejected:", error)
+    assert ch.shortest_path('A', 'D') == (6, ['A', 'B', 'C', 'D'])
+    assert ch.distance('D', 'A') == float('inf')
+
+    for _ in range(30):
+        nodes = list(range(random.randint(1, 60)))
+        graph = {u: [(random.choice(nodes), random.randint(0, 9)) for _ in range(3)] for u in nodes}
+        ch = ContractionHierarchy.build(graph, settle_limit=random.choice([1, 5, 50]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.ch")
+            ch.save(path)
+            ch = ContractionHierarchy.load(path)
+        for s in nodes:
+            expected = dijkstra(graph, s)
+            for t in nodes:
+                distance, path = ch.shortest_path(s, t)
+                assert distance == expected[t]
+                if path:
+                    weights = [min(w for x, w in graph[a] if x == b) for a, b in zip(path, path[1:])]
+                    assert path[0] == s and path[-1] == t and sum(weights) == distance
+    print("All contraction hierarchy tests passed.")
@@ -1,4 +1,9 @@
 import heapq
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson5"))
+from minheap import IndexedMinHeap  # noqa: E402
 
 def dijkstra(graph, source):
     distances = {node: float('inf') for node in graph}
@@ -19,11 +24,154 @@ def dijkstra(graph, source):
 
     return distances
 
+def dijkstra_decrease_key(graph, source, arity=4):
+    """Dijkstra with an indexed heap: each node is queued at most once, so the queue stays O(V)."""
+    distances = {node: float('inf') for node in graph}
+    distances[source] = 0
+    pq = IndexedMinHeap([(source, 0)], arity=arity)
+
+    while pq:
+        current_node, current_distance = pq.pop()
+
+        for neighbor, weight in graph[current_node]:
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                if neighbor in pq:
+                    pq.decrease_key(neighbor, distance)
+                else:
+                    pq.push(neighbor, distance)
+                distances[neighbor] = distance
+
+    return distances
+
+def shortest_path(graph, source, target, method="dijkstra", heuristic=None, stats=None, reverse=None):
+    """Return (distance, path) from source to target, or (inf, []) if target is unreachable.
+
+    Unlike dijkstra(), the search stops as soon as target is settled and keeps
+    predecessors to rebuild the path. method selects the search:
+
+    - "dijkstra": plain Dijkstra with early exit.
+    - "bidirectional": alternates a forward search from source with a backward
+      search from target over the reversed graph, and stops once the two
+      frontiers cannot improve the best meeting point. Pass reverse (the
+      reversed adjacency, e.g. reverse_graph(graph)) when running many queries,
+      otherwise it is rebuilt on every call.
+    - "astar": Dijkstra ordered by distance + heuristic(node, target). The
+      heuristic must never overestimate and must be consistent, e.g. straight-line
+      distance on a road network.
+
+    If stats is a dict, the number of settled nodes is stored in stats["settled"].
+    """
+    if method == "dijkstra":
+        distance, predecessors, settled = _search(graph, source, target, None)
+        path = _unwind(predecessors, target) if distance < float('inf') else []
+    elif method == "astar":
+        if heuristic is None:
+            raise ValueError("method='astar' requires a heuristic")
+        distance, predecessors, settled = _search(graph, source, target, heuristic)
+        path = _unwind(predecessors, target) if distance < float('inf') else []
+    elif method == "bidirectional":
+        if reverse is None:
+            reverse = reverse_graph(graph)
+        distance, path, settled = _bidirectional(graph, reverse, source, target)
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    if stats is not None:
+        stats["settled"] = settled
+    return distance, path
+
+def reverse_graph(graph):
+    """Return the graph with every edge u -> v turned into v -> u, as a dict of lists."""
+    reverse = {node: [] for node in graph}
+    for node in graph:
+        for neighbor, weight in graph[node]:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    return reverse
+
+def _search(graph, source, target, heuristic):
+    distances = {source: 0}
+    predecessors = {source: None}
+    settled = set()
+    start = heuristic(source, target) if heuristic else 0
+    pq = [(start, 0, source)]
+
+    while pq:
+        _, current_distance, current_node = heapq.heappop(pq)
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+        if current_node == target:
+            return current_distance, predecessors, len(settled)
+
+        for neighbor, weight in graph[current_node]:
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_node
+                priority = distance + heuristic(neighbor, target) if heuristic else distance
+                heapq.heappush(pq, (priority, distance, neighbor))
+
+    return float('inf'), predecessors, len(settled)
+
+def _bidirectional(graph, reverse, source, target):
+    if source == target:
+        return 0, [source], 1
+    # Index 0 is the forward search from source, 1 the backward search from target
+    adjacency = (graph, reverse)
+    distances = ({source: 0}, {target: 0})
+    predecessors = ({source: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, source)], [(0, target)])
+    best, meeting = float('inf'), None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break  # No path through the unsettled frontiers can beat best
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+
+        other = distances[1 - side]
+        for neighbor, weight in adjacency[side][current_node]:
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor, float('inf')):
+                distances[side][neighbor] = distance
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(queues[side], (distance, neighbor))
+            if neighbor in other and distances[side][neighbor] + other[neighbor] < best:
+                best = distances[side][neighbor] + other[neighbor]
+                meeting = neighbor
+
+    count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return float('inf'), [], count
+    path = _unwind(predecessors[0], meeting)
+    node = predecessors[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = predecessors[1][node]
+    return best, path, count
+
+def _unwind(predecessors, node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    path.reverse()
+    return path
+
 # Example Usage
-graph = {
-    'A': [('B', 1), ('C', 4)],
-    'B': [('C', 2), ('D', 6)],
-    'C': [('D', 3)],
-    'D': []
-}
-print(dijkstra(graph, 'A'))
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 6)],
+        'C': [('D', 3)],
+        'D': []
+    }
+    print(dijkstra(graph, 'A'))
+    assert dijkstra_decrease_key(graph, 'A') == dijkstra(graph, 'A')
+    assert shortest_path(graph, 'A', 'D') == (6, ['A', 'B', 'C', 'D'])
+    assert shortest_path(graph, 'A', 'D', method="bidirectional") == (6, ['A', 'B', 'C', 'D'])
+    assert shortest_path(graph, 'D', 'A') == (float('inf'), [])
@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only used by floyd_warshall_matrix()
+    np = None
+
+
 def floyd_warshall(graph):
     nodes = list(graph.keys())
     dist = {node: {n: float('inf') for n in nodes} for node in nodes}
@@ -14,12 +20,154 @@ def floyd_warshall(graph):
 
     return dist
 
-# Example Usage
-graph = {
-    'A': [('B', 1)],
-    'B': [('C', 2)],
-    'C': [('A', 3)]
-}
-dist_matrix = floyd_warshall(graph)
-for node in dist_matrix:
-    print(f"{node}: {dist_matrix[node]}")
+
+class ShortestPaths:
+    """All-pairs result of floyd_warshall_matrix().
+
+    dist[i][j] is the shortest distance between the nodes with indexes i and j,
+    and next_hop[i][j] is the index of the node that follows i on that path, or
+    -1 when j is unreachable. labels maps indexes back to the graph's nodes.
+    """
+
+    def __init__(self, labels, dist, next_hop):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.dist = dist
+        self.next_hop = next_hop
+
+    def distance(self, u, v):
+        return self.dist[self.index[u], self.index[v]].item()
+
+    def path(self, u, v):
+        """Return the nodes of a shortest path from u to v, or [] when v is unreachable."""
+        i, j = self.index[u], self.index[v]
+        if self.next_hop[i, j] < 0:
+            return []
+        path = [u]
+        while i != j:
+            i = self.next_hop[i, j].item()
+            path.append(self.labels[i])
+        return path
+
+    def to_dict(self):
+        """Return the distances as nested dicts, in the same shape as floyd_warshall()."""
+        rows = self.dist.tolist()
+        return {u: dict(zip(self.labels, row)) for u, row in zip(self.labels, rows)}
+
+
+def floyd_warshall_matrix(graph, dtype="float64", block_size=None):
+    """Floyd-Warshall over a dense NumPy matrix instead of nested dicts.
+
+    Node labels are mapped to indexes 0..n-1 and each step k relaxes the whole
+    matrix at once by broadcasting column k against row k, so the interpreter
+    runs n steps instead of n^3. dtype="float32" halves memory and bandwidth at
+    the cost of precision. With block_size the matrix is processed in tiles of
+    that size (the 3-phase blocked algorithm), so every temporary holds at most
+    block_size^2 entries instead of n^2.
+
+    Returns a ShortestPaths. Raises ValueError when a negative cycle shows up as
+    a negative entry on the diagonal.
+    """
+    if np is None:
+        raise ImportError("floyd_warshall_matrix() requires NumPy")
+    labels = list(graph.keys())
+    index = {label: i for i, label in enumerate(labels)}
+    for node in list(labels):
+        for neighbor, _ in graph[node]:
+            if neighbor not in index:
+                index[neighbor] = len(labels)
+                labels.append(neighbor)
+
+    n = len(labels)
+    dist = np.full((n, n), np.inf, dtype=dtype)
+    next_hop = np.full((n, n), -1, dtype=np.int64)
+    for node in graph.keys():
+        i = index[node]
+        for neighbor, weight in graph[node]:
+            j = index[neighbor]
+            if weight < dist[i, j]:  # Keep the lightest of parallel edges
+                dist[i, j] = weight
+                next_hop[i, j] = j
+    diagonal = np.arange(n)
+    dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0)
+    next_hop[diagonal, diagonal] = diagonal
+
+    if block_size is None or block_size >= n:
+        _relax(dist, next_hop, slice(0, n), slice(0, n), range(n))
+    else:
+        _relax_blocked(dist, next_hop, block_size)
+
+    negative = np.flatnonzero(dist[diagonal, diagonal] < 0)
+    if len(negative):
+        raise ValueError(f"graph contains a negative cycle through {[labels[i] for i in negative]}")
+    return ShortestPaths(labels, dist, next_hop)
+
+
+def _relax(dist, next_hop, rows, cols, ks):
+    """Run the Floyd-Warshall steps ks on the rows x cols slab of the matrix."""
+    d = dist[rows, cols]
+    h = next_hop[rows, cols]
+    via = np.empty_like(d)
+    better = np.empty(d.shape, dtype=bool)
+    for k in ks:
+        # Copies, since column k and row k may change within step k itself
+        np.add(dist[rows, k, None], dist[k, None, cols], out=via)
+        np.less(via, d, out=better)
+        np.copyto(d, via, where=better)
+        np.copyto(h, next_hop[rows, k, None].copy(), where=better)
+
+
+def _relax_blocked(dist, next_hop, block_size):
+    n = len(dist)
+    tiles = [slice(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+    for kb in tiles:
+        ks = range(kb.start, kb.stop)
+        # Phase 1: close the diagonal tile over its own pivots
+        _relax(dist, next_hop, kb, kb, ks)
+        # Phase 2: the rest of row and column block kb, through the final diagonal tile
+        for other in tiles:
+            if other != kb:
+                _relax(dist, next_hop, kb, other, ks)
+                _relax(dist, next_hop, other, kb, ks)
+        # Phase 3: every other tile, through row and column block kb, which are
+        # now final. Each _relax call only allocates block_size^2 buffers
+        for rows in tiles:
+            for cols in tiles:
+                if rows != kb and cols != kb:
+                    _relax(dist, next_hop, rows, cols, ks)
+
+
+if __name__ == "__main__":
+    # Example Usage
+    graph = {
+        'A': [('B', 1)],
+        'B': [('C', 2)],
+        'C': [('A', 3)]
+    }
+    dist_matrix = floyd_warshall(graph)
+    for node in dist_matrix:
+        print(f"{node}: {dist_matrix[node]}")
+
+    if np is not None:
+        paths = floyd_warshall_matrix(graph)
+        assert paths.to_dict() == dist_matrix
+        print("Path C -> B:", paths.path('C', 'B'), "distance", paths.distance('C', 'B'))
+
+        import random
+        nodes = list(range(60))
+        random_graph = {u: [(v, random.randint(1, 20)) for v in random.sample(nodes[:u] + nodes[u + 1:], 4)]
+                        for u in nodes}
+        expected = floyd_warshall(random_graph)
+        for options in ({}, {"block_size": 16}, {"dtype": "float32", "block_size": 7}):
+            paths = floyd_warshall_matrix(random_graph, **options)
+            assert paths.to_dict() == expected, options
+            for u, v in [(0, 1), (5, 17), (42, 3)]:
+                path = paths.path(u, v)
+                weight = sum(dict(random_graph[a])[b] for a, b in zip(path, path[1:]))
+                assert path[0] == u and path[-1] == v and weight == expected[u][v]
+
+        try:
+            floyd_warshall_matrix({'A': [('B', 1)], 'B': [('A', -2)]})
+            assert False, "negative cycle not detected"
+        except ValueError as error:
+            print("Rejected:", error)
@@ -0,0 +1,189 @@
+import sys
+from collections import OrderedDict
+
+from dijkstra import dijkstra
+
+
+class ShortestPathOracle:
+    """Answers shortest-distance queries on a slowly changing graph with an LRU cache.
+
+    Each cached entry is the full single-source result of dijkstra() for one
+    source. Entries are evicted least recently used first once their estimated
+    size passes max_bytes. Edge updates made through the oracle drop only the
+    entries whose distances they can change:
+
+    - a new or cheaper edge u -> v with weight w matters to source s only if
+      d_s[u] + w < d_s[v];
+    - a removed or more expensive edge matters only if it was tight, i.e.
+      d_s[u] + old weight == d_s[v].
+
+    The hits, misses, evictions and invalidations counters help size max_bytes.
+    """
+
+    def __init__(self, graph, max_bytes=64 << 20):
+        self.graph = {node: list(graph[node]) for node in graph.keys()}
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._cache = OrderedDict()  # source -> (distances, estimated bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, source):
+        return source in self._cache
+
+    def distances(self, source):
+        """Return the distances from source to every node; treat the dict as read-only."""
+        entry = self._cache.get(source)
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(source)
+            return entry[0]
+        self.misses += 1
+        if source not in self.graph:
+            raise KeyError(source)
+        distances = dijkstra(self.graph, source)
+        self._store(source, distances)
+        return distances
+
+    def distance(self, source, target):
+        if target not in self.graph:
+            raise KeyError(target)
+        return self.distances(source)[target]
+
+    def query_many(self, pairs):
+        """Answer a batch of (source, target) queries, computing each source at most once.
+
+        Queries are grouped by source, so a batch is served even when its sources
+        do not all fit in the cache at the same time. Results follow the input order.
+        """
+        by_source = {}
+        pairs = list(pairs)
+        for i, (source, _) in enumerate(pairs):
+            by_source.setdefault(source, []).append(i)
+        results = [None] * len(pairs)
+        for source, indexes in by_source.items():
+            distances = self.distances(source)
+            for i in indexes:
+                target = pairs[i][1]
+                if target not in self.graph:
+                    raise KeyError(target)
+                results[i] = distances[target]
+        return results
+
+    def add_edge(self, u, v, weight):
+        """Add an edge u -> v, creating either node if it is new."""
+        for node in (u, v):
+            if node not in self.graph:
+                self.graph[node] = []
+                # Every cached entry gains a key, so re-account its size
+                for source, (distances, size) in self._cache.items():
+                    distances[node] = float('inf')
+                    new_size = _estimate_size(distances)
+                    self._cache[source] = (distances, new_size)
+                    self.bytes_used += new_size - size
+                self._evict()
+        self.graph[u].append((v, weight))
+        self._invalidate_where(lambda d: d[u] + weight < d[v])
+
+    def remove_edge(self, u, v):
+        """Remove every edge u -> v; raise KeyError if there is none."""
+        old = self._edge_weight(u, v)
+        self.graph[u] = [(x, w) for x, w in self.graph[u] if x != v]
+        self._invalidate_where(lambda d: d[u] + old == d[v])
+
+    def update_edge(self, u, v, weight):
+        """Replace every edge u -> v with a single edge of the given weight."""
+        old = self._edge_weight(u, v)
+        self.graph[u] = [(x, w) for x, w in self.graph[u] if x != v]
+        self.graph[u].append((v, weight))
+        if weight < old:
+            self._invalidate_where(lambda d: d[u] + weight < d[v])
+        elif weight > old:
+            self._invalidate_where(lambda d: d[u] + old == d[v])
+
+    def invalidate(self, source=None):
+        """Drop the cached entry for source, or every entry when source is None."""
+        sources = list(self._cache) if source is None else [source] if source in self._cache else []
+        for s in sources:
+            self.bytes_used -= self._cache.pop(s)[1]
+            self.invalidations += 1
+
+    def _edge_weight(self, u, v):
+        weights = [w for x, w in self.graph.get(u, ()) if x == v]
+        if not weights:
+            raise KeyError((u, v))
+        return min(weights)  # Only the lightest of parallel edges can be on a shortest path
+
+    def _invalidate_where(self, affected):
+        for source in [s for s, (distances, _) in self._cache.items() if affected(distances)]:
+            self.bytes_used -= self._cache.pop(source)[1]
+            self.invalidations += 1
+
+    def _store(self, source, distances):
+        size = _estimate_size(distances)
+        if size > self.max_bytes:
+            return
+        self._cache[source] = (distances, size)
+        self.bytes_used += size
+        self._evict()
+
+    def _evict(self):
+        while self.bytes_used > self.max_bytes:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self.bytes_used -= evicted
+            self.evictions += 1
+
+
+def _estimate_size(distances):
+    # The node keys are shared with the graph, so count the dict and its float values
+    return sys.getsizeof(distances) + sys.getsizeof(0.0) * len(distances)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 6)],
+        'C': [('D', 3)],
+        'D': []
+    }
+    oracle = ShortestPathOracle(graph)
+    print(oracle.query_many([('A', 'D'), ('B', 'D'), ('A', 'C')]))
+    assert oracle.distance('A', 'D') == 6 and oracle.hits == 1 and oracle.misses == 2
+
+    oracle.add_edge('D', 'B', 5)  # Not useful to A or B: their caches survive
+    assert 'A' in oracle and 'B' in oracle
+    oracle.add_edge('A', 'D', 2)  # Shortcut for A only
+    assert 'A' not in oracle and 'B' in oracle
+    oracle.remove_edge('B', 'C')  # Tight for B, not for A
+    assert 'B' not in oracle
+    assert oracle.distance('B', 'D') == 6 and oracle.distance('A', 'D') == 2
+
+    import random
+    nodes = list(range(40))
+    graph = {u: [(random.choice(nodes), random.randint(1, 9)) for _ in range(3)] for u in nodes}
+    oracle = ShortestPathOracle(graph, max_bytes=8000)
+    for _ in range(300):
+        u, v = random.sample(nodes, 2)
+        action = random.random()
+        if action < 0.3:
+            oracle.add_edge(u, v, random.randint(1, 9))
+        elif action < 0.5 and any(x == v for x, _ in oracle.graph[u]):
+            if random.random() < 0.5:
+                oracle.remove_edge(u, v)
+            else:
+                oracle.update_edge(u, v, random.randint(1, 9))
+        s, t = random.choice(nodes), random.choice(nodes)
+        assert oracle.distance(s, t) == dijkstra(oracle.graph, s)[t]
+        assert oracle.bytes_used <= oracle.max_bytes
+    print(f"hits={oracle.hits} misses={oracle.misses} evictions={oracle.evictions} "
+          f"invalidations={oracle.invalidations} hit rate={oracle.hit_rate:.0%}")
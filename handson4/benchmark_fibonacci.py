@@ -0,0 +1,62 @@
+import random
+import sys
+import time
+
+from fibonacci import fib, fib_iterative, fib_many, fib_memo, fib_mod, fib_naive
+
+
+def time_per_call(f, n, budget=0.2):
+    """Average seconds per f(n), repeating the call for about budget seconds."""
+    calls = 0
+    start_time = time.time()
+    while True:
+        f(n)
+        calls += 1
+        elapsed = time.time() - start_time
+        if elapsed >= budget:
+            return elapsed / calls
+
+
+def benchmark_fibonacci(max_exponent):
+    print(f"{'n':>9s} {'fib_naive':>12s} {'fib_iterative':>14s} {'fib':>12s} {'fib_memo':>12s} (cold)")
+    for n in [10, 20, 30, 50, 100, 300, 1000] + [10**e for e in range(4, max_exponent + 1)]:
+        row = [f"{n:9d}"]
+        for f, limit in ((fib_naive, 25), (fib_iterative, 10**5), (fib, None), (fib_memo, None)):
+            if limit is not None and n > limit:
+                row.append(f"{'-':>12s}")
+                continue
+            if f is fib_memo:
+                fib_memo.cache_clear()  # Measure the cold cost; warm calls are dict lookups
+                start_time = time.time()
+                f(n)
+                seconds = time.time() - start_time
+            else:
+                seconds = time_per_call(f, n)
+            row.append(f"{seconds * 1e6:10.1f}us")
+        print(" ".join(row))
+
+    ns = [random.randrange(10**4) for _ in range(1000)]
+    start_time = time.time()
+    separate = [fib(n) for n in ns]
+    separate_time = time.time() - start_time
+    start_time = time.time()
+    assert fib_many(ns) == separate
+    batch_time = time.time() - start_time
+    print(f"1000 random n < 10^4: [fib(n) for n in ns] {separate_time * 1e3:.1f}ms, "
+          f"fib_many(ns) {batch_time * 1e3:.1f}ms")
+
+    n = 10**max_exponent
+    for m in (1000, 10**9 + 7):
+        start_time = time.time()
+        fib_mod(n, m)
+        mod_time = time.time() - start_time
+        print(f"fib_mod(10^{max_exponent}, {m}): {mod_time * 1e6:.1f}us (first call)")
+    start_time = time.time()
+    fib(n) % 1000
+    print(f"fib(10^{max_exponent}) % 1000: {(time.time() - start_time) * 1e6:.1f}us")
+
+
+# Example usage: python benchmark_fibonacci.py 6
+if __name__ == "__main__":
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    benchmark_fibonacci(max_exponent)
@@ -1,6 +1,219 @@
-def fib(n):
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+PISANO_LIMIT = 1 << 16  # Largest modulus whose Pisano period fib_mod() precomputes
+PISANO_CACHE_SIZE = 1024  # Moduli whose periods stay cached
+ITERATIVE_CUTOFF = 40  # Below this a plain loop beats fast doubling (see benchmark_fibonacci.py)
+MEMO_MAX_BITS = 1 << 27  # Total size of the pairs fib_memo() keeps, about 16 MiB
+
+
+def fib_naive(n):
     if n == 0:
         return 0
     if n == 1:
         return 1
-    return fib(n-1) + fib(n-2)
+    return fib_naive(n-1) + fib_naive(n-2)
+
+
+def _check(n):
+    if n < 0:
+        raise ValueError("n must be non-negative")
+
+
+def _fib_pair(n, m=None):
+    """Return (F(n), F(n+1)) by fast doubling, optionally modulo m.
+
+    Walks the bits of n from the top with F(2k) = F(k) * (2F(k+1) - F(k)) and
+    F(2k+1) = F(k)^2 + F(k+1)^2, so it takes O(log n) big-integer products.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if m is not None:
+            c %= m
+            d %= m
+        if bit == "1":
+            a, b = d, c + d
+            if m is not None:
+                b %= m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib(n):
+    """Return the n-th Fibonacci number in O(log n) arithmetic operations."""
+    _check(n)
+    if n < ITERATIVE_CUTOFF:
+        return fib_iterative(n)
+    return _fib_pair(n)[0]
+
+
+def fib_iterative(n):
+    """Return F(n) with a plain loop; faster than fib() for small n."""
+    _check(n)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+@lru_cache(maxsize=PISANO_CACHE_SIZE)
+def pisano_period(m):
+    """Return the period of the Fibonacci sequence modulo m (at most 6m)."""
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m == 1:
+        return 1
+    a, b = 0, 1
+    for period in range(1, 6 * m + 1):
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return period
+    raise AssertionError("Pisano period exceeds 6m")
+
+
+def fib_mod(n, m):
+    """Return F(n) mod m without building F(n).
+
+    Fast doubling with every product reduced mod m takes O(log n) steps, while
+    finding the Pisano period of m takes up to 6m. So only when n has more
+    bits than m (and m is at most PISANO_LIMIT) is n first reduced modulo the
+    period, which stays cached for the PISANO_CACHE_SIZE most recent moduli.
+    """
+    _check(n)
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m <= PISANO_LIMIT and n.bit_length() > m:
+        n %= pisano_period(m)
+    return _fib_pair(n, m)[0] % m
+
+
+def fib_many(ns):
+    """Return [F(n) for n in ns], sharing work across the batch.
+
+    The distinct values are visited in increasing order. Short gaps are
+    walked with additions; long gaps jump with F(k + d) = F(k)F(d + 1) +
+    F(k - 1)F(d) using one fast-doubling call for d.
+    """
+    ns = list(ns)
+    for n in ns:
+        _check(n)
+    results = {}
+    k, a, b = 0, 0, 1  # a = F(k), b = F(k + 1)
+    for n in sorted(set(ns)):
+        gap = n - k
+        if gap <= 64:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            c, d = _fib_pair(gap)
+            a, b = a * (d - c) + b * c, a * c + b * d
+        k = n
+        results[n] = a
+    return [results[n] for n in ns]
+
+
+class _PairCache:
+    """LRU cache of k -> (F(k), F(k+1)) bounded by the total bit length of the pairs.
+
+    Counting entries would not bound memory: one pair near n = 10^8 alone
+    holds about 17 MB of digits. Pairs bigger than the whole budget are not
+    stored.
+    """
+
+    def __init__(self, max_bits):
+        self.max_bits = max_bits
+        self.bits = 0
+        self.hits = 0
+        self.misses = 0
+        self._pairs = OrderedDict()  # k -> ((F(k), F(k+1)), bits)
+
+    def get(self, k):
+        entry = self._pairs.get(k)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pairs.move_to_end(k)
+        return entry[0]
+
+    def put(self, k, pair):
+        bits = pair[0].bit_length() + pair[1].bit_length()
+        if bits > self.max_bits or k in self._pairs:
+            return
+        self._pairs[k] = (pair, bits)
+        self.bits += bits
+        while self.bits > self.max_bits:
+            _, (_, evicted) = self._pairs.popitem(last=False)
+            self.bits -= evicted
+
+    def cache_info(self):
+        return MemoInfo(self.hits, self.misses, len(self._pairs), self.bits, self.max_bits)
+
+    def cache_clear(self):
+        self._pairs.clear()
+        self.bits = self.hits = self.misses = 0
+
+
+MemoInfo = namedtuple("MemoInfo", "hits misses entries bits max_bits")
+_memo = _PairCache(MEMO_MAX_BITS)
+
+
+def _fib_pair_memo(n):
+    # Walk down the halving chain n, n//2, ... to the first cached pair, then
+    # double back up, caching every pair on the way
+    chain = []
+    pair = (0, 1)
+    while n:
+        cached = _memo.get(n)
+        if cached is not None:
+            pair = cached
+            break
+        chain.append(n)
+        n >>= 1
+    a, b = pair
+    for k in reversed(chain):
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if k & 1 else (c, d)
+        _memo.put(k, (a, b))
+    return a, b
+
+
+def fib_memo(n):
+    """Fast doubling through an LRU cache of (F(k), F(k+1)) pairs.
+
+    Nearby and repeated queries share the halving chain n, n//2, n//4, ...,
+    so a cache hit replaces big-integer products. The cache is bounded by
+    MEMO_MAX_BITS bits of Fibonacci digits in total, not by a number of
+    entries; see fib_memo.cache_info() and fib_memo.cache_clear().
+    """
+    _check(n)
+    return _fib_pair_memo(n)[0]
+
+
+fib_memo.cache_info = _memo.cache_info
+fib_memo.cache_clear = _memo.cache_clear
+
+if __name__ == "__main__":
+    expected = [fib_naive(n) for n in range(25)]
+    for f in (fib, fib_iterative, fib_memo):
+        assert [f(n) for n in range(25)] == expected
+    assert fib_many([24, 3, 3, 0, 10]) == [expected[24], 2, 2, 0, 55]
+    assert fib(1000) == fib_iterative(1000) == fib_many([1000])[0]
+    assert fib_many([5, 300, 1000, 5000]) == [fib(n) for n in (5, 300, 1000, 5000)]
+    for m in (1, 2, 10, 97, 1000, PISANO_LIMIT + 1):
+        assert all(fib_mod(n, m) == fib(n) % m for n in (0, 1, 2, 50, 999, 12345))
+    assert pisano_period(10) == 60
+    assert fib_mod(10**30, 10) == _fib_pair(10**30, 10)[0] % 10  # Reduced by the period
+    fib_memo.cache_clear()
+    assert fib_memo(10**5) == fib(10**5) and fib_memo(10**5 + 1) == fib(10**5 + 1)
+    assert fib_memo.cache_info().hits > 0 and fib_memo.cache_info().bits <= MEMO_MAX_BITS
+    try:
+        fib(-1)
+        assert False, "negative n accepted"
+    except ValueError:
+        pass
+    print("fib(100) =", fib(100))
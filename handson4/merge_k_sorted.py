@@ -1,20 +1,78 @@
 import heapq
+from array import array
 
 def merge_k_sorted_arrays(arrays):
     merged_array = []
     min_heap = []
-    
-    # Insert the first element of each array along with the array index and element index
+
+    # Insert the first element of each non-empty array along with the array index and element index
     for i in range(len(arrays)):
-        heapq.heappush(min_heap, (arrays[i][0], i, 0))
-    
+        if len(arrays[i]) > 0:
+            heapq.heappush(min_heap, (arrays[i][0], i, 0))
+
     while min_heap:
         value, array_idx, element_idx = heapq.heappop(min_heap)
         merged_array.append(value)
-        
+
         # If there is a next element in the same array, push it to the heap
         if element_idx + 1 < len(arrays[array_idx]):
             next_value = arrays[array_idx][element_idx + 1]
             heapq.heappush(min_heap, (next_value, array_idx, element_idx + 1))
-    
+
     return merged_array
+
+def merge_k_sorted_iter(iterables, key=None):
+    """Lazily merge sorted iterables, yielding one item at a time.
+
+    Inputs may be any iterators (generators, file readers, other merges) and may be
+    empty. Only the current head of each input is held in memory. Ties are
+    yielded in input order, so the merge is stable.
+    """
+    min_heap = []
+    # Each heap entry is (sort key, input index, item, iterator); the index breaks
+    # ties, so items themselves are never compared
+    for i, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            min_heap.append((item if key is None else key(item), i, item, iterator))
+            break
+    heapq.heapify(min_heap)
+
+    while len(min_heap) > 1:
+        _, i, item, iterator = min_heap[0]
+        yield item
+        for item in iterator:
+            heapq.heapreplace(min_heap, (item if key is None else key(item), i, item, iterator))
+            break
+        else:
+            heapq.heappop(min_heap)
+
+    # A single remaining input can be streamed without the heap
+    if min_heap:
+        _, _, item, iterator = min_heap[0]
+        yield item
+        yield from iterator
+
+def iter_sorted_run(path, typecode="q", chunk_items=1 << 16):
+    """Stream the values of a binary run file written with array.tofile().
+
+    Only chunk_items values are buffered at a time, so a run of any size can be
+    fed to merge_k_sorted_iter in bounded memory.
+    """
+    itemsize = array(typecode).itemsize
+    with open(path, "rb") as run_file:
+        while True:
+            data = run_file.read(chunk_items * itemsize)
+            if not data:
+                return
+            chunk = array(typecode)
+            chunk.frombytes(data)
+            yield from chunk
+
+if __name__ == "__main__":
+    arrays = [[1, 4, 7], [], [2, 5, 8], [3, 6, 9]]
+    assert merge_k_sorted_arrays(arrays) == list(range(1, 10))
+    assert list(merge_k_sorted_iter(iter(a) for a in arrays)) == list(range(1, 10))
+    assert list(merge_k_sorted_iter([])) == []
+    assert list(merge_k_sorted_iter([["Apple", "pear"], ["banana"], ["Cherry"]], key=str.lower)) == ["Apple", "banana", "Cherry", "pear"]
+    print("Merged:", merge_k_sorted_arrays(arrays))
@@ -1,14 +1,179 @@
-def remove_duplicates(arr):
-    if not arr:
-        return []
-    
-    # Pointer for the next unique element
+import hashlib
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only used by method="numpy"
+    np = None
+
+
+def remove_duplicates(arr, method="sorted"):
+    """Return the distinct values of arr in their original order, leaving arr untouched.
+
+    method selects the algorithm:
+
+    - "sorted": arr is sorted, so a value is new when it differs from the
+      previous one. O(N) time and no extra memory beyond the result.
+    - "hash": arr may be in any order; keeps the first occurrence of each value
+      using a set. O(N) expected time, O(distinct) memory.
+    - "numpy": arr is a numeric array; returns a NumPy array. Sorted input is
+      detected and handled with a single vectorized comparison, other input
+      with np.unique, keeping first occurrences in order.
+    """
+    if method == "sorted":
+        result = []
+        for value in arr:
+            if not result or value != result[-1]:
+                result.append(value)
+        return result
+    if method == "hash":
+        return list(dedup_stream(arr))
+    if method == "numpy":
+        if np is None:
+            raise ImportError("method='numpy' requires NumPy")
+        values = np.asarray(arr)
+        if len(values) == 0:
+            return values.copy()
+        if np.all(values[1:] >= values[:-1]):
+            keep = np.empty(len(values), dtype=bool)
+            keep[0] = True
+            np.not_equal(values[1:], values[:-1], out=keep[1:])
+            return values[keep]
+        _, first = np.unique(values, return_index=True)
+        return values[np.sort(first)]
+    raise ValueError(f"unknown method {method!r}")
+
+
+def remove_duplicates_inplace(arr):
+    """Compact the distinct values of a sorted mutable sequence to its front.
+
+    Works on lists, array.array, NumPy arrays or writable memoryviews without
+    allocating a copy, and returns the new length n: arr[:n] holds the distinct
+    values and the items after it are left over. Truncate with del arr[n:]
+    where the sequence supports it.
+    """
+    if len(arr) == 0:
+        return 0
+
+    # Pointer for the last unique element
     unique_index = 0
-    
+
     for i in range(1, len(arr)):
         if arr[i] != arr[unique_index]:
             unique_index += 1
             arr[unique_index] = arr[i]
-    
-    # Slice the array up to the last unique element
-    return arr[:unique_index + 1]
+
+    return unique_index + 1
+
+
+def dedup_stream(iterable, key=None):
+    """Yield each item of iterable the first time its key (the item itself by default) is seen.
+
+    Lazy and order-preserving, so it works on unbounded event streams; memory
+    grows with the number of distinct keys. See dedup_approx() to bound it.
+    """
+    seen = set()
+    for item in iterable:
+        marker = item if key is None else key(item)
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+def _digest64(item):
+    """Stable 64-bit hash of item: BLAKE2b over its bytes, its UTF-8 text or its repr().
+
+    Unlike hash() it does not change with PYTHONHASHSEED and does not map
+    -1 and -2 (or other small ints) to related values.
+    """
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        data = item
+    elif isinstance(item, str):
+        data = item.encode("utf-8", "surrogatepass")
+    else:
+        data = repr(item).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class BloomFilter:
+    """Fixed-size set membership test that may report false positives but never false negatives.
+
+    Sized for capacity items at the given false-positive rate: m bits in a
+    bytearray and k bit positions per item, derived from one 64-bit BLAKE2b
+    digest by double hashing. The digest does not depend on PYTHONHASHSEED, so
+    the bits mean the same in every run. Items other than str and bytes are
+    identified by their repr(),
+    so values that compare equal but print differently (1 and 1.0) are
+    distinct to the filter.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        h = _digest64(item)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Insert item; return True if it was possibly present already."""
+        present = True
+        bits = self.bits
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self):
+        """Number of items added that were definitely new."""
+        return self.count
+
+
+def dedup_approx(iterable, capacity, error_rate=0.01, key=None):
+    """Like dedup_stream(), but in fixed memory: about 1.2 bytes per key at a 1% error rate.
+
+    Never yields a duplicate. A new item is wrongly dropped with probability
+    about error_rate while at most capacity distinct keys have been seen; past
+    that the rate climbs, so size capacity for the expected distinct count.
+    """
+    bloom = BloomFilter(capacity, error_rate)
+    for item in iterable:
+        if not bloom.add(item if key is None else key(item)):
+            yield item
+
+
+if __name__ == "__main__":
+    arr = [1, 2, 2, 3, 4, 4, 4, 5, 5]
+    print(remove_duplicates(arr))
+    assert arr == [1, 2, 2, 3, 4, 4, 4, 5, 5]  # The input is no longer modified
+
+    n = remove_duplicates_inplace(arr)
+    assert n == 5 and arr[:n] == [1, 2, 3, 4, 5]
+    assert remove_duplicates([3, 1, 3, 2, 1], method="hash") == [3, 1, 2]
+    assert list(dedup_stream(["b", "a", "B", "c"], key=str.lower)) == ["b", "a", "c"]
+    if np is not None:
+        assert remove_duplicates(np.array([3, 1, 3, 2, 1]), method="numpy").tolist() == [3, 1, 2]
+        assert remove_duplicates(np.array([1, 1, 2, 5, 5]), method="numpy").tolist() == [1, 2, 5]
+
+    import random
+    events = [random.randrange(20000) for _ in range(50000)]
+    approx = list(dedup_approx(events, capacity=20000, error_rate=0.01))
+    exact = list(dedup_stream(events))
+    assert len(set(approx)) == len(approx) and set(approx) <= set(exact)
+    print(f"dedup_approx kept {len(approx)} of {len(exact)} distinct events")
+    bloom = BloomFilter(100)
+    bloom.add(-1)
+    assert -1 in bloom and -2 not in bloom  # hash(-1) == hash(-2), the digest tells them apart
@@ -0,0 +1,81 @@
+import heapq
+import random
+import sys
+import time
+
+from minheap import IndexedMinHeap, MinHeap
+
+
+def benchmark_push_pop(n):
+    """Time n pushes followed by n pops (2n operations) for each heap."""
+    priorities = [random.random() for _ in range(n)]
+    times = {}
+
+    start_time = time.time()
+    heap = []
+    for priority in priorities:
+        heapq.heappush(heap, priority)
+    while heap:
+        heapq.heappop(heap)
+    times["heapq"] = time.time() - start_time
+
+    start_time = time.time()
+    min_heap = MinHeap()
+    for priority in priorities:
+        min_heap.push(priority)
+    while min_heap.heap:
+        min_heap.pop()
+    times["MinHeap"] = time.time() - start_time
+
+    for arity in (2, 4):
+        start_time = time.time()
+        indexed = IndexedMinHeap(arity=arity)
+        for handle, priority in enumerate(priorities):
+            indexed.push(handle, priority)
+        while indexed:
+            indexed.pop()
+        times[f"IndexedMinHeap(arity={arity})"] = time.time() - start_time
+    return times
+
+
+def benchmark_decrease_key(n, updates_per_item=4):
+    """Time a Dijkstra-like workload: lazy duplicate entries against decrease_key."""
+    updates = [(random.randrange(n), random.random()) for _ in range(n * updates_per_item)]
+    times = {}
+
+    start_time = time.time()
+    heap = [(1.0, handle) for handle in range(n)]
+    best = [1.0] * n
+    for handle, priority in updates:
+        if priority < best[handle]:
+            best[handle] = priority
+            heapq.heappush(heap, (priority, handle))
+    peak = len(heap)
+    while heap:
+        priority, handle = heapq.heappop(heap)
+        if priority > best[handle]:
+            continue  # Stale duplicate entry
+    times[f"heapq lazy (peak {peak} entries)"] = time.time() - start_time
+
+    for arity in (2, 4):
+        start_time = time.time()
+        indexed = IndexedMinHeap(((handle, 1.0) for handle in range(n)), arity=arity)
+        for handle, priority in updates:
+            if priority < indexed[handle]:
+                indexed.decrease_key(handle, priority)
+        peak = len(indexed)
+        while indexed:
+            indexed.pop()
+        times[f"IndexedMinHeap(arity={arity}) (peak {peak} entries)"] = time.time() - start_time
+    return times
+
+
+# Example usage: python benchmark_minheap.py 500000   (500000 pushes + 500000 pops = 1e6 ops)
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 5 * 10**5
+    print(f"{n} pushes + {n} pops")
+    for name, elapsed in benchmark_push_pop(n).items():
+        print(f"  {name:>46}: {elapsed:7.3f}s")
+    print(f"{n // 4} items, {n} priority updates")
+    for name, elapsed in benchmark_decrease_key(n // 4).items():
+        print(f"  {name:>46}: {elapsed:7.3f}s")
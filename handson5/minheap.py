@@ -1,32 +1,45 @@
 class MinHeap:
-    def __init__(self, data=None):
-        """Initialize the heap."""
-        self.heap = []
+    def __init__(self, data=None, storage=list):
+        """Initialize the heap.
+
+        storage is a zero-argument factory for the backing sequence, which needs
+        len(), indexing, append(), extend() and pop(). For numeric items,
+        storage=DynamicArray (handson11) keeps them unboxed in one int64 buffer.
+        """
+        self.storage = storage
+        self.heap = storage()
         if data:
             self.build_min_heap(data)
 
     def build_min_heap(self, data):
         """Build a min-heap from an initial list of data."""
-        self.heap = data[:]
+        self.heap = self.storage()
+        self.heap.extend(data)
+        self._heapify_all()
+
+    def _heapify_all(self):
         # Build heap (start from the last parent and heapify down)
         for i in range((len(self.heap) - 2) >> 1, -1, -1):
             self.heapify(i)
 
     def heapify(self, i):
         """Ensure the heap property is maintained starting from index i."""
-        size = len(self.heap)
-        left = (i << 1) + 1
-        right = (i << 1) + 2
-        smallest = i
+        heap = self.heap
+        size = len(heap)
+        while True:
+            left = (i << 1) + 1
+            right = (i << 1) + 2
+            smallest = i
 
-        if left < size and self.heap[left] < self.heap[smallest]:
-            smallest = left
-        if right < size and self.heap[right] < self.heap[smallest]:
-            smallest = right
+            if left < size and heap[left] < heap[smallest]:
+                smallest = left
+            if right < size and heap[right] < heap[smallest]:
+                smallest = right
 
-        if smallest != i:
-            self.heap[i], self.heap[smallest] = self.heap[smallest], self.heap[i]
-            self.heapify(smallest)
+            if smallest == i:
+                return
+            heap[i], heap[smallest] = heap[smallest], heap[i]
+            i = smallest
 
     def push(self, item):
         """Add an item to the heap."""
@@ -54,6 +67,30 @@ class MinHeap:
         self.heapify(0)  # Re-heapify starting from the root
         return root
 
+    def pushpop(self, item):
+        """Push item, then pop and return the smallest item, in one sift."""
+        if self.heap and self.heap[0] < item:
+            item, self.heap[0] = self.heap[0], item
+            self.heapify(0)
+        return item
+
+    def push_many(self, items):
+        """Add several items, rebuilding the heap when that is cheaper than sifting each."""
+        items = list(items)
+        if len(items) > len(self.heap):
+            self.heap.extend(items)
+            self._heapify_all()
+        else:
+            for item in items:
+                self.push(item)
+
+    def merge(self, other):
+        """Add every item of another heap to this one, leaving the other unchanged."""
+        self.push_many(other.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
     def peek(self):
         """Return the smallest item without removing it."""
         if len(self.heap) == 0:
@@ -62,7 +99,173 @@ class MinHeap:
 
     def __str__(self):
         """Return a string representation of the heap."""
-        return str(self.heap)
+        return str(list(self.heap))
+
+
+class IndexedMinHeap:
+    """Min-priority queue of distinct handles that supports decrease-key and removal.
+
+    Priorities and handles live in two parallel lists, and a dict maps each handle
+    to its current slot, so any entry can be found in O(1) and re-sifted in
+    O(log n). `arity` sets the number of children per node; a 4-ary layout is
+    shallower and keeps siblings next to each other in memory.
+    """
+
+    def __init__(self, items=None, arity=2):
+        """Initialize the heap from optional (handle, priority) pairs."""
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.priorities = []
+        self.handles = []
+        self.position = {}
+        if items:
+            self.push_many(items)
+
+    def __len__(self):
+        return len(self.handles)
+
+    def __contains__(self, handle):
+        return handle in self.position
+
+    def __getitem__(self, handle):
+        """Return the current priority of handle."""
+        return self.priorities[self.position[handle]]
+
+    def items(self):
+        """Return the (handle, priority) pairs in heap order."""
+        return list(zip(self.handles, self.priorities))
+
+    def push(self, handle, priority):
+        """Add a new handle with the given priority."""
+        if handle in self.position:
+            raise ValueError(f"handle {handle!r} is already in the heap")
+        self.handles.append(handle)
+        self.priorities.append(priority)
+        self.position[handle] = len(self.handles) - 1
+        self._sift_up(len(self.handles) - 1)
+
+    def pop(self):
+        """Remove and return the (handle, priority) pair with the smallest priority."""
+        if not self.handles:
+            raise IndexError("pop from empty heap")
+        handle = self.handles[0]
+        priority = self.priorities[0]
+        self._remove_at(0)
+        return handle, priority
+
+    def peek(self):
+        """Return the (handle, priority) pair with the smallest priority without removing it."""
+        if not self.handles:
+            raise IndexError("peek from empty heap")
+        return self.handles[0], self.priorities[0]
+
+    def pushpop(self, handle, priority):
+        """Push a pair, then pop and return the smallest pair, in one sift."""
+        if handle in self.position:
+            raise ValueError(f"handle {handle!r} is already in the heap")
+        if not self.handles or not self.priorities[0] < priority:
+            return handle, priority
+        result = self.handles[0], self.priorities[0]
+        del self.position[result[0]]
+        self.handles[0] = handle
+        self.priorities[0] = priority
+        self.position[handle] = 0
+        self._sift_down(0)
+        return result
+
+    def decrease_key(self, handle, priority):
+        """Lower the priority of a handle already in the heap."""
+        i = self.position[handle]
+        if self.priorities[i] < priority:
+            raise ValueError("new priority is greater than the current priority")
+        self.priorities[i] = priority
+        self._sift_up(i)
+
+    def remove(self, handle):
+        """Remove handle from the heap and return its priority."""
+        i = self.position[handle]
+        priority = self.priorities[i]
+        self._remove_at(i)
+        return priority
+
+    def push_many(self, items):
+        """Add several (handle, priority) pairs, rebuilding bottom-up when that is cheaper."""
+        items = list(items)
+        if len(items) <= len(self.handles):
+            for handle, priority in items:
+                self.push(handle, priority)
+            return
+        new_handles = {handle for handle, _ in items}
+        if len(new_handles) != len(items) or not new_handles.isdisjoint(self.position):
+            raise ValueError("push_many was given a duplicate handle")
+        for handle, priority in items:
+            self.position[handle] = len(self.handles)
+            self.handles.append(handle)
+            self.priorities.append(priority)
+        # Build heap (start from the last parent and sift down)
+        for i in range((len(self.handles) - 2) // self.arity, -1, -1):
+            self._sift_down(i)
+
+    def merge(self, other):
+        """Add every entry of another heap to this one, leaving the other unchanged."""
+        self.push_many(other.items())
+
+    def _remove_at(self, i):
+        del self.position[self.handles[i]]
+        last_handle = self.handles.pop()
+        last_priority = self.priorities.pop()
+        if i == len(self.handles):
+            return
+        self.handles[i] = last_handle
+        self.priorities[i] = last_priority
+        self.position[last_handle] = i
+        if i and last_priority < self.priorities[(i - 1) // self.arity]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        """Move the entry at index i up to restore the heap property."""
+        priorities, handles, position, arity = self.priorities, self.handles, self.position, self.arity
+        priority = priorities[i]
+        handle = handles[i]
+        # Shift parents down into the hole instead of swapping at every level
+        while i > 0:
+            parent = (i - 1) // arity
+            if not priority < priorities[parent]:
+                break
+            priorities[i] = priorities[parent]
+            handles[i] = handles[parent]
+            position[handles[i]] = i
+            i = parent
+        priorities[i] = priority
+        handles[i] = handle
+        position[handle] = i
+
+    def _sift_down(self, i):
+        """Move the entry at index i down to restore the heap property."""
+        priorities, handles, position, arity = self.priorities, self.handles, self.position, self.arity
+        size = len(priorities)
+        priority = priorities[i]
+        handle = handles[i]
+        while True:
+            first = i * arity + 1
+            if first >= size:
+                break
+            smallest = first
+            for child in range(first + 1, min(first + arity, size)):
+                if priorities[child] < priorities[smallest]:
+                    smallest = child
+            if not priorities[smallest] < priority:
+                break
+            priorities[i] = priorities[smallest]
+            handles[i] = handles[smallest]
+            position[handles[i]] = i
+            i = smallest
+        priorities[i] = priority
+        handles[i] = handle
+        position[handle] = i
 
 
 # Demonstration of heap functionality
@@ -88,3 +291,9 @@ if __name__ == "__main__":
     while heap.heap:
         print("Pop root:", heap.pop())
         print("Heap after pop:", heap)
+
+    # Example 6: Indexed heap with decrease-key and removal
+    indexed = IndexedMinHeap([("a", 5), ("b", 3), ("c", 8), ("d", 1)], arity=4)
+    indexed.decrease_key("c", 0)
+    print("Removed d with priority", indexed.remove("d"))
+    print("Indexed pops:", [indexed.pop() for _ in range(len(indexed))])
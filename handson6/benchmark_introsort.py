@@ -0,0 +1,47 @@
+import random
+import sys
+import time
+from array import array
+
+from introsort import introsort, np
+from quicksort import quicksort
+from quicksort_random import quicksort_random
+
+
+def generate(n, case_type):
+    if case_type == "sorted":
+        return list(range(n))
+    if case_type == "reversed":
+        return list(range(n, 0, -1))
+    if case_type == "duplicates":
+        return [random.randint(0, 10) for _ in range(n)]
+    return [random.randint(0, n) for _ in range(n)]
+
+
+def benchmark_sorts(arr_sizes, case_type="average"):
+    """Time each sort on the same input; in-place sorts get a fresh copy."""
+    sorts = {
+        "quicksort": lambda data: quicksort(data),
+        "quicksort_random": lambda data: quicksort_random(data),
+        "introsort(list)": lambda data: introsort(data[:]),
+        "introsort(array)": lambda data: introsort(array("q", data)),
+    }
+    if np is not None:
+        sorts["introsort(numpy)"] = lambda data: introsort(np.array(data))
+    times = {name: [] for name in sorts}
+    for n in arr_sizes:
+        arr = generate(n, case_type)
+        for name, sort in sorts.items():
+            start_time = time.time()
+            sort(arr)
+            times[name].append(time.time() - start_time)
+    return times
+
+
+# Example usage: python benchmark_introsort.py 10000 100000 1000000
+if __name__ == "__main__":
+    arr_sizes = [int(float(arg)) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    for case_type in ["average", "sorted", "reversed", "duplicates"]:
+        print(f"{case_type} case")
+        for name, times in benchmark_sorts(arr_sizes, case_type).items():
+            print(f"  {name:>18}: " + "  ".join(f"n={n}: {t:.3f}s" for n, t in zip(arr_sizes, times)))
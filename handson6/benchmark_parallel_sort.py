@@ -0,0 +1,26 @@
+import os
+import random
+import sys
+import time
+
+from parallel_sort import parallel_sort
+
+
+def benchmark_parallel_sort(n, max_workers):
+    """Time parallel_sort on the same random input for 1..max_workers processes."""
+    data = [random.randint(0, n) for _ in range(n)]
+    times = []
+    for workers in range(1, max_workers + 1):
+        start_time = time.time()
+        parallel_sort(data, workers=workers)
+        times.append(time.time() - start_time)
+    return times
+
+
+# Example usage: python benchmark_parallel_sort.py 1000000 8
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    times = benchmark_parallel_sort(n, max_workers)
+    for workers, elapsed in enumerate(times, start=1):
+        print(f"workers={workers:>2}  time: {elapsed:7.3f}s  speedup: {times[0] / elapsed:5.2f}x")
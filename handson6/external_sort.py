@@ -0,0 +1,161 @@
+import os
+import struct
+import sys
+import tempfile
+from array import array, typecodes
+
+from introsort import introsort
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson4"))
+from merge_k_sorted import iter_sorted_run, merge_k_sorted_iter  # noqa: E402
+
+
+class RecordFormat:
+    """Binary layout of the fixed-size records in an input, run or output file.
+
+    A single array typecode such as "q" or "d" describes a file of plain numbers,
+    which are read, sorted and written as compact array.array chunks. Any other
+    struct format, e.g. "<dqq", describes tuple records that sort field by field.
+    """
+
+    def __init__(self, fmt):
+        self.scalar = len(fmt) == 1 and fmt in typecodes
+        if self.scalar:
+            self.typecode = fmt
+            self.size = array(fmt).itemsize
+            self.memory_size = self.size
+        else:
+            self.struct = struct.Struct(fmt)
+            self.size = self.struct.size
+            # A record held in a list costs a slot, the tuple and one object per
+            # field, several times its packed size
+            record = self.struct.unpack(b"\xff" * self.size)
+            self.memory_size = 8 + sys.getsizeof(record) + sum(sys.getsizeof(field) for field in record)
+
+    def read_chunk(self, f, count):
+        """Read up to count records from f into a mutable, sortable sequence."""
+        data = f.read(count * self.size)
+        if len(data) % self.size:
+            raise ValueError(f"file size is not a multiple of the {self.size}-byte record size")
+        if self.scalar:
+            chunk = array(self.typecode)
+            chunk.frombytes(data)
+            return chunk
+        return list(self.struct.iter_unpack(data))
+
+    def write(self, f, records):
+        if self.scalar:
+            if not (isinstance(records, array) and records.typecode == self.typecode):
+                records = array(self.typecode, records)
+            records.tofile(f)
+        else:
+            f.write(b"".join(self.struct.pack(*record) for record in records))
+
+    def iter_file(self, path, chunk_records):
+        """Stream the records of path while buffering chunk_records at a time."""
+        if self.scalar:
+            yield from iter_sorted_run(path, self.typecode, chunk_records)
+            return
+        with open(path, "rb") as f:
+            while True:
+                chunk = self.read_chunk(f, chunk_records)
+                if not chunk:
+                    return
+                yield from chunk
+
+
+def write_records(path, records, fmt="q"):
+    """Write an iterable of records to path in the given binary format."""
+    record_format = RecordFormat(fmt)
+    with open(path, "wb") as f:
+        record_format.write(f, records)
+
+
+def read_records(path, fmt="q", chunk_records=1 << 16):
+    """Stream the records stored in path in the given binary format."""
+    return RecordFormat(fmt).iter_file(path, chunk_records)
+
+
+def external_sort(input_path, output_path, memory_limit=64 << 20, fmt="q", fan_in=16, tmp_dir=None):
+    """Sort a binary file of fixed-size records that may be larger than RAM.
+
+    memory_limit bounds the records held in memory, counted at their in-memory
+    size: 8 bytes per "q" value, but about 150 bytes per "<dqq" tuple. Phase 1
+    reads as many records as fit in memory_limit at a time, sorts each chunk in
+    place with introsort and spills it as a binary run. Phase 2 merges at most
+    fan_in runs at a time with merge_k_sorted_iter, passing over the runs again
+    until fan_in or fewer remain, and streams the final merge into output_path.
+    Returns the number of merge passes made, including the final one.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    record_format = RecordFormat(fmt)
+    chunk_records = max(1, memory_limit // record_format.memory_size)
+    # During a merge the budget is shared by fan_in input buffers and one output buffer
+    buffer_records = max(1, chunk_records // (fan_in + 1))
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        runs = []
+        with open(input_path, "rb") as f:
+            while True:
+                chunk = record_format.read_chunk(f, chunk_records)
+                if not chunk:
+                    break
+                introsort(chunk)
+                run_path = os.path.join(work_dir, f"run-0-{len(runs)}.bin")
+                with open(run_path, "wb") as run_file:
+                    record_format.write(run_file, chunk)
+                runs.append(run_path)
+                del chunk
+
+        passes = 1
+        while len(runs) > fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                run_path = os.path.join(work_dir, f"run-{passes}-{len(merged_runs)}.bin")
+                _merge_runs(group, run_path, record_format, buffer_records)
+                for path in group:
+                    os.remove(path)
+                merged_runs.append(run_path)
+            runs = merged_runs
+            passes += 1
+        _merge_runs(runs, output_path, record_format, buffer_records)
+    return passes
+
+
+def _merge_runs(run_paths, output_path, record_format, buffer_records):
+    merged = merge_k_sorted_iter([record_format.iter_file(path, buffer_records) for path in run_paths])
+    with open(output_path, "wb") as out:
+        batch = []
+        for record in merged:
+            batch.append(record)
+            if len(batch) >= buffer_records:
+                record_format.write(out, batch)
+                batch.clear()
+        record_format.write(out, batch)
+
+
+if __name__ == "__main__":
+    import random
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "input.bin")
+        target = os.path.join(tmp, "output.bin")
+
+        values = [random.randint(-10**12, 10**12) for _ in range(20000)]
+        write_records(source, values)
+        # 8 KiB of memory holds 1024 values, so 20 runs need three passes at fan-in 4 (20 -> 5 -> 2 -> 1)
+        passes = external_sort(source, target, memory_limit=8 << 10, fan_in=4)
+        assert list(read_records(target)) == sorted(values)
+        assert passes == 3
+
+        edges = [(random.random(), random.randrange(100), random.randrange(100)) for _ in range(5000)]
+        write_records(source, edges, "<dqq")
+        external_sort(source, target, memory_limit=64 << 10, fmt="<dqq")
+        assert list(read_records(target, "<dqq")) == sorted(edges)
+
+        write_records(source, [])
+        external_sort(source, target)
+        assert list(read_records(target)) == []
+    print("All external sort tests passed.")
@@ -0,0 +1,176 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; lists, arrays and memoryviews work without it
+    np = None
+
+INSERTION_SORT_THRESHOLD = 16  # Slices this small are finished with insertion sort
+NINTHER_THRESHOLD = 128  # Slices this large pick the pivot with Tukey's ninther
+
+
+def introsort(arr, low=0, high=None):
+    """Sort arr[low:high] in place.
+
+    Works on any mutable sequence that supports len() and integer indexing: lists,
+    array.array, writable memoryviews and NumPy arrays. Quicksort with a
+    median-of-three (or ninther) pivot does the bulk of the work, small slices
+    are finished with insertion sort, and a slice that recurses deeper than
+    2*log2(n) levels falls back to heapsort, so the worst case is O(n log n).
+    Pending slices sit on an explicit stack that holds O(log n) entries.
+    """
+    if high is None:
+        high = len(arr)
+    if high - low < 2:
+        return
+    if np is not None and hasattr(arr, "memoryview"):
+        arr = np.asarray(arr.memoryview())  # A handson11 DynamicArray, viewed without copying
+    if np is not None and isinstance(arr, np.ndarray) and arr.dtype.kind in "biuf":
+        # NumPy's own introsort partitions the numeric buffer in C, in place
+        arr[low:high].sort(kind="quicksort")
+        return
+
+    # Each entry is an inclusive (low, high, depth_limit) slice still to be sorted
+    stack = [(low, high - 1, 2 * (high - low).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                heapsort(arr, lo, hi + 1)
+                break
+            depth -= 1
+            pivot_index = _choose_pivot(arr, lo, hi)
+            if lo > low and not arr[lo - 1] < arr[pivot_index]:
+                # arr[lo - 1] is <= everything here, so the pivot is the slice's
+                # minimum: gather its copies in one pass and never revisit them
+                lo = _partition_equal(arr, lo, hi, arr[pivot_index])
+                continue
+            split = _partition(arr, lo, hi, pivot_index)
+            # Keep working on the smaller side and defer the larger one,
+            # which bounds the stack at O(log n) entries
+            if split - lo < hi - split:
+                stack.append((split + 1, hi, depth))
+                hi = split
+            else:
+                stack.append((lo, split, depth))
+                lo = split + 1
+        else:
+            insertion_sort(arr, lo, hi + 1)
+
+
+def insertion_sort(arr, low=0, high=None):
+    """Sort arr[low:high] in place by insertion."""
+    if high is None:
+        high = len(arr)
+    for i in range(low + 1, high):
+        item = arr[i]
+        j = i - 1
+        while j >= low and item < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = item
+
+
+def heapsort(arr, low=0, high=None):
+    """Sort arr[low:high] in place with an iterative max-heap."""
+    if high is None:
+        high = len(arr)
+    n = high - low
+    for start in range((n - 2) >> 1, -1, -1):
+        _sift_down(arr, low, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+
+def _sift_down(arr, base, i, size):
+    item = arr[base + i]
+    child = (i << 1) + 1
+    while child < size:
+        if child + 1 < size and arr[base + child] < arr[base + child + 1]:
+            child += 1
+        if not item < arr[base + child]:
+            break
+        arr[base + i] = arr[base + child]
+        i = child
+        child = (i << 1) + 1
+    arr[base + i] = item
+
+
+def _median_of_three(arr, a, b, c):
+    """Return the index of the median of arr[a], arr[b] and arr[c]."""
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+
+def _choose_pivot(arr, lo, hi):
+    """Return the index of a median-of-three (or ninther) pivot for arr[lo..hi]."""
+    mid = (lo + hi) >> 1
+    if hi - lo >= NINTHER_THRESHOLD:
+        step = (hi - lo) >> 3
+        return _median_of_three(
+            arr,
+            _median_of_three(arr, lo, lo + step, lo + 2 * step),
+            _median_of_three(arr, mid - step, mid, mid + step),
+            _median_of_three(arr, hi - 2 * step, hi - step, hi),
+        )
+    return _median_of_three(arr, lo, mid, hi)
+
+
+def _partition_equal(arr, lo, hi, pivot):
+    """Move the items of arr[lo..hi] that are not greater than pivot to the front; return the next index."""
+    i = lo
+    for j in range(lo, hi + 1):
+        if not pivot < arr[j]:
+            arr[i], arr[j] = arr[j], arr[i]
+            i += 1
+    return i
+
+
+def _partition(arr, lo, hi, pivot_index):
+    """Hoare-partition arr[lo..hi] around arr[pivot_index] and return j with arr[lo..j] <= arr[j+1..hi]."""
+    # With the pivot moved to arr[lo], the scan always stops with lo <= j < hi
+    arr[lo], arr[pivot_index] = arr[pivot_index], arr[lo]
+    pivot = arr[lo]
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+if __name__ == "__main__":
+    import random
+    from array import array
+
+    for n in [0, 1, 2, 15, 16, 17, 100, 1000, 5000]:
+        for data in ([random.randint(0, n) for _ in range(n)], list(range(n)), list(range(n, 0, -1)), [7] * n):
+            expected = sorted(data)
+            values = data[:]
+            introsort(values)
+            assert values == expected, f"introsort failed on a list of size {n}"
+            typed = array("q", data)
+            introsort(typed)
+            assert typed.tolist() == expected, f"introsort failed on an array of size {n}"
+
+    # The heapsort fallback must also sort correctly on its own
+    data = [random.random() for _ in range(1000)]
+    heapsort(data)
+    assert data == sorted(data)
+
+    # Sorting part of a buffer leaves the rest untouched
+    data = [5, 4, 3, 2, 1, 0]
+    introsort(data, 1, 5)
+    assert data == [5, 1, 2, 3, 4, 0]
+    print("All introsort tests passed.")
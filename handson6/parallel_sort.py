@@ -0,0 +1,83 @@
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from introsort import introsort
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson4"))
+from merge_k_sorted import merge_k_sorted_arrays  # noqa: E402
+
+
+def _sort_chunk(name, typecode, start, end):
+    """Worker: attach to the shared buffer and sort one chunk of it in place."""
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(typecode)
+    try:
+        introsort(view, start, end)
+    finally:
+        view.release()
+        shm.close()
+
+
+def _typecode(values):
+    return "q" if all(isinstance(value, int) for value in values) else "d"
+
+
+def parallel_sort(data, workers=None, typecode=None):
+    """Sort numeric data across worker processes and return a sorted list.
+
+    The values are copied once into a shared memory block of int64 ("q") or
+    float64 ("d") items. Each worker sorts its own chunk of that block with
+    introsort, so no chunk is pickled, and the parent merges the sorted runs with
+    merge_k_sorted_arrays. The typecode is inferred from the data when omitted.
+    """
+    if not isinstance(data, array):
+        data = list(data)
+        data = array(typecode or _typecode(data), data)
+    typecode = data.typecode
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or n < 2 * workers:
+        values = array(typecode, data)
+        introsort(values)
+        return values.tolist()
+
+    bounds = [(i * n // workers, (i + 1) * n // workers) for i in range(workers)]
+    shm = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            view[:n] = data
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for _ in pool.map(_sort_chunk, [shm.name] * workers, [typecode] * workers,
+                                  [start for start, _ in bounds], [end for _, end in bounds]):
+                    pass
+            runs = []
+            try:
+                runs.extend(view[start:end] for start, end in bounds)
+                merged = merge_k_sorted_arrays(runs)
+            finally:
+                # The run views must be gone before view.release(), which would
+                # otherwise raise BufferError and hide the original error
+                for run in runs:
+                    run.release()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    return merged
+
+
+if __name__ == "__main__":
+    import random
+
+    data = [random.randint(-1000, 1000) for _ in range(10000)]
+    assert parallel_sort(data, workers=4) == sorted(data)
+    assert parallel_sort(data, workers=1) == sorted(data)
+    floats = [random.random() for _ in range(1000)]
+    assert parallel_sort(floats, workers=3) == sorted(floats)
+    assert parallel_sort([], workers=2) == []
+    print("All parallel sort tests passed.")
@@ -0,0 +1,91 @@
+import multiprocessing
+import sys
+import time
+from collections import deque
+
+from ring_buffer import Queue, SharedRingBuffer
+
+BATCH = 64
+RECORD_FORMAT = "<qd"  # (sequence number, value)
+
+
+def benchmark_in_process(n):
+    items = list(range(BATCH))
+    d = deque()
+    start_time = time.time()
+    for _ in range(n // BATCH):
+        d.extend(items)
+        for _ in range(BATCH):
+            d.popleft()
+    print(f"  deque extend/popleft        {n / (time.time() - start_time) / 1e6:6.2f}M items/s")
+
+    q = Queue(1024)
+    start_time = time.time()
+    for _ in range(n // BATCH):
+        for item in items:
+            q.push(item)
+        for _ in range(BATCH):
+            q.pop()
+    print(f"  Queue push/pop              {n / (time.time() - start_time) / 1e6:6.2f}M items/s")
+
+    start_time = time.time()
+    for _ in range(n // BATCH):
+        q.push_many(items)
+        q.pop_many(BATCH)
+    print(f"  Queue push_many/pop_many    {n / (time.time() - start_time) / 1e6:6.2f}M items/s")
+
+
+def _produce_mp_queue(channel, n):
+    for i in range(0, n, BATCH):
+        channel.put([(j, j * 0.5) for j in range(i, min(n, i + BATCH))])
+    channel.put(None)
+
+
+def _produce_ring(name, n):
+    ring = SharedRingBuffer.attach(name)
+    sent = 0
+    while sent < n:
+        count = min(BATCH, n - sent, ring.capacity - len(ring))
+        if count:
+            ring.push_many([(j, j * 0.5) for j in range(sent, sent + count)])
+            sent += count
+        else:
+            time.sleep(0)  # Yield to the consumer instead of spinning
+    ring.close()
+
+
+def benchmark_processes(n):
+    channel = multiprocessing.Queue(maxsize=64)
+    start_time = time.time()
+    producer = multiprocessing.Process(target=_produce_mp_queue, args=(channel, n))
+    producer.start()
+    received = 0
+    while (batch := channel.get()) is not None:
+        received += len(batch)
+    producer.join()
+    print(f"  multiprocessing.Queue       {received / (time.time() - start_time) / 1e6:6.2f}M records/s")
+
+    ring = SharedRingBuffer(RECORD_FORMAT, 4096)
+    start_time = time.time()
+    producer = multiprocessing.Process(target=_produce_ring, args=(ring.name, n))
+    producer.start()
+    received = 0
+    while received < n:
+        count = min(BATCH, len(ring))
+        if count:
+            ring.pop_many(count)
+            received += count
+        else:
+            time.sleep(0)
+    producer.join()
+    print(f"  SharedRingBuffer            {received / (time.time() - start_time) / 1e6:6.2f}M records/s")
+    ring.close()
+    ring.unlink()
+
+
+# Example usage: python benchmark_ring_buffer.py 1000000
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    print(f"n={n}, batches of {BATCH}")
+    benchmark_in_process(n)
+    benchmark_processes(n)
@@ -1,3 +1,5 @@
+import random
+
 def partition(arr, low, high):
     pivot = arr[high]
     i = low - 1
@@ -8,21 +10,118 @@ def partition(arr, low, high):
     arr[i + 1], arr[high] = arr[high], arr[i + 1]
     return i + 1
 
-def quickselect(arr, low, high, k):
-    if low == high:
-        return arr[low]
+def partition3(arr, low, high, pivot):
+    """Three-way partition arr[low:high] around the value pivot.
+
+    Returns (lt, gt) such that arr[low:lt] < pivot, arr[lt:gt] == pivot and
+    arr[gt:high] > pivot, so runs of equal keys never cause quadratic behaviour.
+    """
+    lt, i, gt = low, low, high
+    while i < gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            gt -= 1
+            arr[gt], arr[i] = arr[i], arr[gt]
+        else:
+            i += 1
+    return lt, gt
+
+def median_of_medians(arr, low, high):
+    """Return a pivot value guaranteed to fall between the 30th and 70th percentiles."""
+    medians = []
+    for i in range(low, high, 5):
+        group = sorted(arr[i:min(i + 5, high)])
+        medians.append(group[(len(group) - 1) >> 1])
+    mid = (len(medians) - 1) >> 1
+    if len(medians) <= 5:
+        return sorted(medians)[mid]
+    nth_element(medians, mid, pivot="median_of_medians")
+    return medians[mid]
+
+def _choose_pivot(arr, low, high, pivot):
+    if pivot == "random":
+        return arr[random.randrange(low, high)]
+    if pivot == "median_of_medians":
+        return median_of_medians(arr, low, high)
+    raise ValueError(f"unknown pivot strategy {pivot!r}")
 
-    pivot_index = partition(arr, low, high)
+def nth_element(arr, k, low=0, high=None, pivot="random"):
+    """Partially sort arr[low:high] in place around index k.
 
-    if k == pivot_index:
-        return arr[k]
-    elif k < pivot_index:
-        return quickselect(arr, low, pivot_index - 1, k)
-    else:
-        return quickselect(arr, pivot_index + 1, high, k)
+    Afterwards arr[k] holds the value it would have if the slice were sorted, every
+    item before it is <= arr[k] and every item after it is >= arr[k]. Runs in
+    expected O(n) with random pivots, or worst-case O(n) with
+    pivot="median_of_medians", using a loop instead of recursion.
+    """
+    if high is None:
+        high = len(arr)
+    if not low <= k < high:
+        raise IndexError("nth_element index out of range")
+    while high - low > 1:
+        lt, gt = partition3(arr, low, high, _choose_pivot(arr, low, high, pivot))
+        if k < lt:
+            high = lt
+        elif k >= gt:
+            low = gt
+        else:
+            return
+
+def quickselect(arr, low, high, k, pivot="random"):
+    """Return the k-th smallest item (0-based index k) of arr[low..high] inclusive."""
+    nth_element(arr, k, low, high + 1, pivot)
+    return arr[k]
+
+def multi_select(arr, ks, pivot="random"):
+    """Return the order statistics at the 0-based indexes ks, partitioning arr in place.
+
+    Each partition step is shared by every requested index that falls in the
+    slice, so finding m statistics costs O(n log m) expected instead of O(n * m).
+    """
+    n = len(arr)
+    for k in ks:
+        if not 0 <= k < n:
+            raise IndexError("multi_select index out of range")
+    targets = sorted(set(ks))
+    # Each entry is a slice arr[low:high] and the sorted targets[first:last] inside it
+    stack = [(0, n, 0, len(targets))]
+    while stack:
+        low, high, first, last = stack.pop()
+        if first == last or high - low <= 1:
+            continue
+        lt, gt = partition3(arr, low, high, _choose_pivot(arr, low, high, pivot))
+        left = first
+        while left < last and targets[left] < lt:
+            left += 1
+        right = left
+        while right < last and targets[right] < gt:
+            right += 1
+        stack.append((low, lt, first, left))
+        stack.append((gt, high, right, last))
+    return [arr[k] for k in ks]
 
 # Example
-arr = [7, 10, 4, 3, 20, 15]
-k = 3  # Find the 3rd smallest element
-result = quickselect(arr, 0, len(arr) - 1, k - 1)  # k-1 because index starts at 0
-print(f"The {k}rd smallest element is {result}")
+if __name__ == "__main__":
+    arr = [7, 10, 4, 3, 20, 15]
+    k = 3  # Find the 3rd smallest element
+    result = quickselect(arr, 0, len(arr) - 1, k - 1)  # k-1 because index starts at 0
+    print(f"The {k}rd smallest element is {result}")
+    assert result == 7
+
+    # Sorted and constant inputs used to be quadratic with the last-element pivot
+    data = list(range(100000))
+    assert quickselect(data, 0, len(data) - 1, 50000) == 50000
+    data = [1] * 100000
+    assert quickselect(data, 0, len(data) - 1, 99999) == 1
+
+    data = [random.randint(0, 1000) for _ in range(10001)]
+    expected = sorted(data)
+    assert quickselect(data[:], 0, len(data) - 1, 5000, pivot="median_of_medians") == expected[5000]
+    nth_element(data, 2500)
+    assert data[2500] == expected[2500]
+    assert max(data[:2500]) <= data[2500] <= min(data[2501:])
+    ks = [0, 100, 5000, 9999, 10000, 100]
+    assert multi_select(data, ks) == [expected[k] for k in ks]
+    print("All quickselect tests passed.")
@@ -0,0 +1,476 @@
+import asyncio
+import queue
+import struct
+import threading
+from multiprocessing import shared_memory
+
+
+class Queue:
+    """Bounded FIFO queue in a fixed ring of slots.
+
+    The Python counterpart of the Queue in stack_queue_linkedlist.cpp, except
+    that head and tail wrap around, so freed slots are reused instead of the
+    queue running out after MAX enqueues in total. Batches are copied with at
+    most two slice assignments, one on each side of the wrap point.
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.slots = [None] * capacity
+        self.head = 0  # Slot of the oldest item
+        self.count = 0
+
+    @property
+    def capacity(self):
+        return len(self.slots)
+
+    def __len__(self):
+        return self.count
+
+    def is_empty(self):
+        return self.count == 0
+
+    def is_full(self):
+        return self.count == len(self.slots)
+
+    def push(self, item):
+        if self.count == len(self.slots):
+            raise IndexError("push to full queue")
+        self.slots[(self.head + self.count) % len(self.slots)] = item
+        self.count += 1
+
+    def pop(self):
+        if self.count == 0:
+            raise IndexError("pop from empty queue")
+        item = self.slots[self.head]
+        self.slots[self.head] = None  # Drop the reference so the item can be freed
+        self.head = (self.head + 1) % len(self.slots)
+        self.count -= 1
+        return item
+
+    def peek(self):
+        if self.count == 0:
+            raise IndexError("peek from empty queue")
+        return self.slots[self.head]
+
+    def push_many(self, items):
+        """Append every item, or none of them if they do not all fit."""
+        items = list(items)
+        n = len(items)
+        capacity = len(self.slots)
+        if n > capacity - self.count:
+            raise IndexError("push_many to full queue")
+        tail = (self.head + self.count) % capacity
+        first = min(n, capacity - tail)
+        self.slots[tail:tail + first] = items[:first]
+        self.slots[:n - first] = items[first:]
+        self.count += n
+
+    def pop_many(self, n):
+        """Remove and return the n oldest items as a list."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > self.count:
+            raise IndexError("pop_many from queue with too few items")
+        capacity = len(self.slots)
+        first = min(n, capacity - self.head)
+        items = self.slots[self.head:self.head + first] + self.slots[:n - first]
+        self.slots[self.head:self.head + first] = [None] * first
+        self.slots[:n - first] = [None] * (n - first)
+        self.head = (self.head + n) % capacity
+        self.count -= n
+        return items
+
+    def __iter__(self):
+        """Yield the items from oldest to newest without removing them."""
+        capacity = len(self.slots)
+        for i in range(self.count):
+            yield self.slots[(self.head + i) % capacity]
+
+
+class Stack:
+    """Bounded LIFO stack in a fixed array of slots, like the Stack in stack_queue_linkedlist.cpp."""
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.slots = [None] * capacity
+        self.count = 0
+
+    @property
+    def capacity(self):
+        return len(self.slots)
+
+    def __len__(self):
+        return self.count
+
+    def is_empty(self):
+        return self.count == 0
+
+    def is_full(self):
+        return self.count == len(self.slots)
+
+    def push(self, item):
+        if self.count == len(self.slots):
+            raise IndexError("push to full stack")
+        self.slots[self.count] = item
+        self.count += 1
+
+    def pop(self):
+        if self.count == 0:
+            raise IndexError("pop from empty stack")
+        self.count -= 1
+        item = self.slots[self.count]
+        self.slots[self.count] = None
+        return item
+
+    def peek(self):
+        if self.count == 0:
+            raise IndexError("peek from empty stack")
+        return self.slots[self.count - 1]
+
+    def push_many(self, items):
+        """Push every item in order, or none of them if they do not all fit."""
+        items = list(items)
+        if len(items) > len(self.slots) - self.count:
+            raise IndexError("push_many to full stack")
+        self.slots[self.count:self.count + len(items)] = items
+        self.count += len(items)
+
+    def pop_many(self, n):
+        """Pop n items and return them in pop order, the top of the stack first."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > self.count:
+            raise IndexError("pop_many from stack with too few items")
+        start = self.count - n
+        items = self.slots[start:self.count]
+        items.reverse()
+        self.slots[start:self.count] = [None] * n
+        self.count = start
+        return items
+
+
+class BlockingQueue:
+    """Thread-safe bounded Queue whose put and get wait for room or items.
+
+    Follows the queue.Queue conventions: with block=False, or once timeout
+    seconds have passed, put raises queue.Full and get raises queue.Empty.
+    put_many adds a batch atomically, so it waits until the whole batch fits.
+    """
+
+    def __init__(self, capacity):
+        self._ring = Queue(capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def capacity(self):
+        return self._ring.capacity
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ring)
+
+    def put(self, item, block=True, timeout=None):
+        self.put_many([item], block, timeout)
+
+    def get(self, block=True, timeout=None):
+        return self.get_many(1, block, timeout)[0]
+
+    def put_many(self, items, block=True, timeout=None):
+        items = list(items)
+        if len(items) > self._ring.capacity:
+            raise ValueError("batch is larger than the queue capacity")
+        with self._not_full:
+            if not _wait_for(self._not_full, lambda: self._ring.capacity - len(self._ring) >= len(items),
+                             block, timeout):
+                raise queue.Full
+            self._ring.push_many(items)
+            self._not_empty.notify(len(items))
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """Remove and return between 1 and max_items of the oldest items."""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        with self._not_empty:
+            if not _wait_for(self._not_empty, lambda: len(self._ring) > 0, block, timeout):
+                raise queue.Empty
+            items = self._ring.pop_many(min(max_items, len(self._ring)))
+            self._not_full.notify_all()  # A waiting batch may need all of the freed room
+            return items
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+def _wait_for(condition, predicate, block, timeout):
+    """Wait on condition, held by the caller, until predicate() is true; False on timeout."""
+    if predicate():
+        return True
+    if not block:
+        return False
+    if timeout is None:
+        return condition.wait_for(predicate)
+    if timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+    return condition.wait_for(predicate, timeout)
+
+
+class AsyncQueue:
+    """Bounded Queue for asyncio tasks.
+
+    put() suspends the producer while the queue is full, which is the
+    backpressure that keeps a fast producer from buffering without limit;
+    get() suspends the consumer while it is empty. The _nowait methods raise
+    asyncio.QueueFull and asyncio.QueueEmpty instead of waiting. Wrap calls in
+    asyncio.wait_for() for timeouts.
+
+    Everything runs on one event loop, so no lock is needed: a task cannot be
+    interrupted between checking the ring and changing it.
+    """
+
+    def __init__(self, capacity):
+        self._ring = Queue(capacity)
+        self._getters = []  # Futures of tasks waiting for items
+        self._putters = []  # Futures of tasks waiting for room
+
+    @property
+    def capacity(self):
+        return self._ring.capacity
+
+    def __len__(self):
+        return len(self._ring)
+
+    async def put(self, item):
+        await self.put_many([item])
+
+    async def get(self):
+        return (await self.get_many(1))[0]
+
+    async def put_many(self, items):
+        """Add a batch atomically, waiting until all of it fits."""
+        items = list(items)
+        if len(items) > self._ring.capacity:
+            raise ValueError("batch is larger than the queue capacity")
+        while self._ring.capacity - len(self._ring) < len(items):
+            await _wait(self._putters)
+        self._ring.push_many(items)
+        _wake_all(self._getters)
+
+    async def get_many(self, max_items):
+        """Remove and return between 1 and max_items of the oldest items."""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        while self._ring.is_empty():
+            await _wait(self._getters)
+        items = self._ring.pop_many(min(max_items, len(self._ring)))
+        _wake_all(self._putters)
+        return items
+
+    def put_nowait(self, item):
+        if self._ring.is_full():
+            raise asyncio.QueueFull
+        self._ring.push(item)
+        _wake_all(self._getters)
+
+    def get_nowait(self):
+        if self._ring.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._ring.pop()
+        _wake_all(self._putters)
+        return item
+
+
+async def _wait(waiters):
+    """Suspend until _wake_all(waiters); the caller re-checks its condition afterwards."""
+    waiter = asyncio.get_running_loop().create_future()
+    waiters.append(waiter)
+    try:
+        await waiter
+    finally:
+        if waiter in waiters:
+            waiters.remove(waiter)  # Cancelled or timed out before being woken
+
+
+def _wake_all(waiters):
+    # Every waiter re-checks, since a woken batch may still not fit
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_result(None)
+    waiters.clear()
+
+
+_HEADER = struct.Struct("<qqq40s")  # Read count, write count, capacity, record format
+_HEAD, _TAIL = 0, 1  # Indexes of the counters in the header viewed as int64s
+
+
+class SharedRingBuffer:
+    """Single-producer, single-consumer ring of fixed-size records in shared memory.
+
+    Records are tuples packed with a struct format such as "<qd", so they pass
+    between processes without pickling. The header holds two monotonically
+    increasing counters: the consumer only writes the read count and the
+    producer only writes the write count, each an aligned 8-byte store, so
+    neither side takes a lock. A record is written before the write count
+    that publishes it. With more than one producer or consumer, guard each
+    side with a multiprocessing.Lock.
+
+    push and pop raise IndexError when the ring is full or empty, as Queue
+    does; callers that need to wait poll or pair the ring with an Event.
+    """
+
+    def __init__(self, record_format, capacity, name=None):
+        """Create a new ring; other processes open it with SharedRingBuffer.attach(ring.name)."""
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        record = struct.Struct(record_format)
+        if len(record_format.encode()) > 40:
+            raise ValueError("record format is too long")
+        size = _HEADER.size + capacity * record.size
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(self._shm.buf, 0, 0, 0, capacity, record_format.encode())
+        self._setup(record, capacity)
+
+    @classmethod
+    def attach(cls, name):
+        """Open a ring created by another process."""
+        ring = cls.__new__(cls)
+        ring._shm = shared_memory.SharedMemory(name=name)
+        _, _, capacity, record_format = _HEADER.unpack_from(ring._shm.buf, 0)
+        ring._setup(struct.Struct(record_format.rstrip(b"\0").decode()), capacity)
+        return ring
+
+    def _setup(self, record, capacity):
+        self.record = record
+        self.capacity = capacity
+        self.name = self._shm.name
+        self._counters = self._shm.buf[:16].cast("q")
+        self._data = self._shm.buf[_HEADER.size:_HEADER.size + capacity * record.size]
+
+    def __len__(self):
+        return self._counters[_TAIL] - self._counters[_HEAD]
+
+    def push(self, record):
+        self.push_many([record])
+
+    def pop(self):
+        return self.pop_many(1)[0]
+
+    def push_many(self, records):
+        """Append every record, or none of them if they do not all fit."""
+        records = list(records)
+        tail = self._counters[_TAIL]
+        if len(records) > self.capacity - (tail - self._counters[_HEAD]):
+            raise IndexError("push_many to full ring")
+        packed = b"".join([self.record.pack(*record) for record in records])
+        self._copy_in(tail % self.capacity, packed)
+        self._counters[_TAIL] = tail + len(records)  # Publish the records
+
+    def pop_many(self, n):
+        """Remove and return the n oldest records as a list of tuples."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        head = self._counters[_HEAD]
+        if n > self._counters[_TAIL] - head:
+            raise IndexError("pop_many from ring with too few records")
+        size = self.record.size
+        start = (head % self.capacity) * size
+        first = min(n, self.capacity - head % self.capacity) * size
+        records = list(self.record.iter_unpack(self._data[start:start + first]))
+        if first < n * size:
+            records += self.record.iter_unpack(self._data[:n * size - first])
+        self._counters[_HEAD] = head + n  # Hand the slots back to the producer
+        return records
+
+    def _copy_in(self, slot, packed):
+        # Split the bytes at the end of the ring, as Queue.push_many does
+        start = slot * self.record.size
+        first = min(len(packed), len(self._data) - start)
+        self._data[start:start + first] = packed[:first]
+        self._data[:len(packed) - first] = packed[first:]
+
+    def close(self):
+        """Detach this process from the ring; every process calls it once it is done."""
+        self._counters.release()
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory; call once, from the creating process, after close()."""
+        self._shm.unlink()
+
+
+if __name__ == "__main__":
+    q = Queue(4)
+    q.push_many([1, 2, 3])
+    assert q.pop_many(2) == [1, 2]
+    q.push_many([4, 5, 6])  # Wraps around the end of the ring
+    assert list(q) == [3, 4, 5, 6] and q.is_full()
+    try:
+        q.push(7)
+    except IndexError as e:
+        print("Queue:", e)
+    assert [q.pop() for _ in range(4)] == [3, 4, 5, 6]
+
+    s = Stack(3)
+    s.push_many([10, 20])
+    s.push(30)
+    assert s.peek() == 30 and s.pop_many(3) == [30, 20, 10]
+    try:
+        s.pop()
+    except IndexError as e:
+        print("Stack:", e)
+
+    blocking = BlockingQueue(8)
+    received = []
+
+    def consume():
+        while len(received) < 1000:
+            received.extend(blocking.get_many(16))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for start in range(0, 1000, 5):
+        blocking.put_many(range(start, start + 5))
+    consumer.join()
+    assert received == list(range(1000))
+    try:
+        blocking.get(timeout=0.01)
+    except queue.Empty:
+        print("BlockingQueue: get timed out on an empty queue")
+
+    async def pipeline():
+        channel = AsyncQueue(2)
+        out = []
+
+        async def producer():
+            for i in range(10):
+                await channel.put(i)  # Suspends while the consumer is behind
+            await channel.put(None)
+
+        async def consumer():
+            while (item := await channel.get()) is not None:
+                out.append(item)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(producer(), consumer())
+        return out
+
+    assert asyncio.run(pipeline()) == list(range(10))
+
+    ring = SharedRingBuffer("<qd", 4)
+    reader = SharedRingBuffer.attach(ring.name)
+    ring.push_many([(1, 0.5), (2, 1.5)])
+    assert reader.pop() == (1, 0.5) and len(ring) == 1
+    ring.push_many([(3, 2.5), (4, 3.5), (5, 4.5)])
+    assert reader.pop_many(4) == [(2, 1.5), (3, 2.5), (4, 3.5), (5, 4.5)]
+    reader.close()
+    ring.close()
+    ring.unlink()
+    print("All ring buffer tests passed.")
@@ -0,0 +1,89 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "handson5"))
+from minheap import MinHeap  # noqa: E402
+
+
+class _Entry:
+    """Heap entry ordered by key only, so the items themselves are never compared."""
+    __slots__ = ("key", "item")
+
+    def __init__(self, key, item):
+        self.key = key
+        self.item = item
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+class _ReversedEntry(_Entry):
+    __slots__ = ()
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+
+class TopK:
+    """Streaming accumulator for the k largest (or smallest) items seen so far.
+
+    A MinHeap of at most k entries holds the current winners with the weakest
+    one at the root. Each new item is compared against that root and, if it is
+    better, replaces it with a single pushpop, so a stream of n items costs
+    O(n log k) time and O(k) memory.
+    """
+
+    def __init__(self, k, key=None, largest=True):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.heap = MinHeap()
+
+    def push(self, item):
+        """Offer one item to the accumulator."""
+        entry_type = _Entry if self.largest else _ReversedEntry
+        entry = entry_type(item if self.key is None else self.key(item), item)
+        if len(self.heap) < self.k:
+            self.heap.push(entry)
+        elif self.k and self.heap.peek() < entry:
+            self.heap.pushpop(entry)
+
+    def extend(self, iterable):
+        """Offer every item of an iterable to the accumulator."""
+        for item in iterable:
+            self.push(item)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def kth(self):
+        """Return the k-th best item seen so far, e.g. the k-th largest for largest=True."""
+        if len(self.heap) < self.k or not self.k:
+            raise IndexError("fewer than k items have been seen")
+        return self.heap.peek().item
+
+    def items(self):
+        """Return the kept items, best first."""
+        return [entry.item for entry in sorted(self.heap.heap, reverse=True)]
+
+
+if __name__ == "__main__":
+    import random
+
+    stream = [random.randint(0, 10**6) for _ in range(100000)]
+    top = TopK(10)
+    top.extend(iter(stream))
+    assert top.items() == sorted(stream, reverse=True)[:10]
+    assert top.kth() == sorted(stream, reverse=True)[9]
+
+    bottom = TopK(5, largest=False)
+    bottom.extend(stream)
+    assert bottom.items() == sorted(stream)[:5]
+    assert bottom.kth() == sorted(stream)[4]
+
+    words = TopK(2, key=len)
+    words.extend(["pear", "fig", "banana", "kiwi", "cherry"])
+    assert sorted(words.items()) == ["banana", "cherry"]
+    print("Top 10:", top.items())
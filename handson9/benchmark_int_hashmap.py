@@ -0,0 +1,59 @@
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from int_hashmap import IntHashMap
+
+
+def measure(build):
+    """Call build() under tracemalloc and return (map, bytes it still holds)."""
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, current
+
+
+def benchmark_int_hashmap(n):
+    keys = array("q", random.sample(range(1 << 40), n))
+    values = array("q", range(n))
+    probes = [keys[random.randrange(n)] for _ in range(min(n, 10**6))]
+
+    def build_dict():
+        return dict(zip(keys, values))
+
+    def build_map():
+        m = IntHashMap()
+        m.update_from_arrays(keys, values)
+        return m
+
+    print(f"n={n}")
+    for name, build in (("dict", build_dict), ("IntHashMap", build_map)):
+        structure, size = measure(build)
+        start_time = time.time()
+        for key in probes:
+            structure[key]
+        lookup = time.time() - start_time
+        print(f"  {name:12s} {size / n:6.1f} bytes/entry, {len(probes) / lookup / 1e6:6.2f}M lookups/s")
+        del structure
+
+    # One-at-a-time inserts: the worst single insert shows whether a resize stalls
+    m = IntHashMap()
+    worst = 0.0
+    start_time = time.time()
+    for key, value in zip(keys, values):
+        t = time.perf_counter()
+        m[key] = value
+        worst = max(worst, time.perf_counter() - t)
+    elapsed = time.time() - start_time
+    print(f"  IntHashMap[key] = value: {n / elapsed / 1e6:.2f}M inserts/s, slowest insert {worst * 1e3:.2f}ms")
+
+
+# Example usage: python benchmark_int_hashmap.py 10000000
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    benchmark_int_hashmap(n)
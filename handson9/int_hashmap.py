@@ -0,0 +1,272 @@
+from array import array
+
+EMPTY, FULL, TOMBSTONE = 0, 1, 2
+MAX_LOAD_FACTOR = 0.75  # Counting tombstones, which also lengthen probe sequences
+MIN_CAPACITY = 8
+MIGRATE_STEP = 16  # Old slots moved to the new table by each operation during a resize
+_GOLDEN = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, for the multiplication method
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+class _Table:
+    """One open-addressing table: parallel key, value and state columns."""
+
+    __slots__ = ("keys", "values", "states", "mask", "shift", "used", "live")
+
+    def __init__(self, capacity):
+        self.keys = array("q", [0]) * capacity
+        self.values = array("q", [0]) * capacity
+        self.states = bytearray(capacity)
+        self.mask = capacity - 1
+        self.shift = 64 - (capacity.bit_length() - 1)
+        self.used = 0  # FULL and TOMBSTONE slots
+        self.live = 0  # FULL slots
+
+    def slot(self, key):
+        # Multiplication method: the top bits of key * A mod 2^64
+        return ((key * _GOLDEN) & _MASK64) >> self.shift
+
+    def find(self, key):
+        """Return the slot holding key, or -1."""
+        keys, states, mask = self.keys, self.states, self.mask
+        i = self.slot(key)
+        while True:
+            state = states[i]
+            if state == EMPTY:
+                return -1
+            if state == FULL and keys[i] == key:
+                return i
+            i = (i + 1) & mask
+
+    def put(self, key, value):
+        """Insert or overwrite key; return True if it was new."""
+        keys, states, mask = self.keys, self.states, self.mask
+        i = self.slot(key)
+        reuse = -1
+        while True:
+            state = states[i]
+            if state == EMPTY:
+                break
+            if state == FULL:
+                if keys[i] == key:
+                    self.values[i] = value
+                    return False
+            elif reuse < 0:
+                reuse = i
+            i = (i + 1) & mask
+        if reuse >= 0:
+            i = reuse  # Recycle the first tombstone on the probe path
+        else:
+            self.used += 1
+        keys[i] = key
+        self.values[i] = value
+        states[i] = FULL
+        self.live += 1
+        return True
+
+    def remove(self, i):
+        self.states[i] = TOMBSTONE
+        self.live -= 1
+
+    def capacity(self):
+        return len(self.states)
+
+
+class IntHashMap:
+    """Hash map from int64 keys to int64 values, stored in flat arrays.
+
+    Keys and values live in array('q') columns with one state byte per slot,
+    about 17 bytes per slot instead of a dict entry plus two boxed ints.
+    Collisions are resolved with linear probing; deletions leave tombstones
+    that later inserts reuse.
+
+    Resizing is incremental: when the table passes MAX_LOAD_FACTOR a new one
+    is allocated and every following operation moves MIGRATE_STEP old slots
+    into it, so no single insert pays for a full rehash. While a migration is
+    running, lookups check the new table first and then the old one.
+    """
+
+    def __init__(self, capacity=MIN_CAPACITY):
+        self._table = _Table(_round_capacity(capacity))
+        self._old = None  # Table being drained during an incremental resize
+        self._cursor = 0  # Next slot of _old to migrate
+
+    def __len__(self):
+        return self._table.live + (self._old.live if self._old is not None else 0)
+
+    def __contains__(self, key):
+        return self._locate(key)[0] is not None
+
+    def __getitem__(self, key):
+        table, i = self._locate(key)
+        if table is None:
+            raise KeyError(key)
+        return table.values[i]
+
+    def get(self, key, default=None):
+        table, i = self._locate(key)
+        return default if table is None else table.values[i]
+
+    def __setitem__(self, key, value):
+        if self._old is not None:
+            self._migrate(MIGRATE_STEP)
+            if self._old is not None:
+                i = self._old.find(key)
+                if i >= 0:
+                    self._old.remove(i)  # Keep each key in exactly one table
+        table = self._table
+        table.put(key, value)
+        if table.used > MAX_LOAD_FACTOR * table.capacity():
+            self._start_resize()
+
+    def __delitem__(self, key):
+        if self._old is not None:
+            self._migrate(MIGRATE_STEP)
+        table, i = self._locate(key)
+        if table is None:
+            raise KeyError(key)
+        table.remove(i)
+
+    def pop(self, key, *default):
+        table, i = self._locate(key)
+        if table is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = table.values[i]
+        table.remove(i)
+        return value
+
+    def items(self):
+        """Yield (key, value) pairs in slot order."""
+        for table in (self._old, self._table):
+            if table is None:
+                continue
+            keys, values, states = table.keys, table.values, table.states
+            for i in range(table.capacity()):
+                if states[i] == FULL:
+                    yield keys[i], values[i]
+
+    def keys(self):
+        return (key for key, _ in self.items())
+
+    def values(self):
+        return (value for _, value in self.items())
+
+    def __iter__(self):
+        return self.keys()
+
+    def update_from_arrays(self, keys, values):
+        """Insert keys[i] -> values[i] for every i, e.g. from array('q') or NumPy columns.
+
+        The table is grown once up front to hold every new key below the load
+        factor, so a bulk load does one rehash instead of many incremental ones.
+        """
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        if hasattr(keys, "tolist"):
+            keys, values = keys.tolist(), values.tolist()
+        self._migrate(None)
+        needed = _round_capacity(int((len(self) + len(keys)) / MAX_LOAD_FACTOR) + 1)
+        capacity = self._table.capacity()
+        # Tombstones take slots too, so rebuild if they could crowd out the new keys
+        if needed > capacity or self._table.used + len(keys) > MAX_LOAD_FACTOR * capacity:
+            self._rehash(max(needed, capacity))
+        table = self._table
+        put = table.put
+        for key, value in zip(keys, values):
+            put(key, value)
+        if table.used > MAX_LOAD_FACTOR * table.capacity():
+            self._start_resize()
+
+    def capacity(self):
+        return self._table.capacity() + (self._old.capacity() if self._old is not None else 0)
+
+    def nbytes(self):
+        """Return the bytes held by the key, value and state columns."""
+        return sum(t.keys.itemsize * len(t.keys) * 2 + len(t.states)
+                   for t in (self._table, self._old) if t is not None)
+
+    def _locate(self, key):
+        i = self._table.find(key)
+        if i >= 0:
+            return self._table, i
+        if self._old is not None:
+            i = self._old.find(key)
+            if i >= 0:
+                return self._old, i
+        return None, -1
+
+    def _start_resize(self):
+        self._migrate(None)  # A previous resize must be complete first
+        old = self._table
+        # Double when genuinely full; otherwise rebuild at the same size to drop tombstones
+        capacity = old.capacity() * 2 if old.live >= old.capacity() // 2 else old.capacity()
+        self._old = old
+        self._table = _Table(capacity)
+        self._cursor = 0
+
+    def _migrate(self, steps):
+        """Move up to steps old slots (all of them if steps is None) into the new table."""
+        old = self._old
+        if old is None:
+            return
+        end = old.capacity() if steps is None else min(old.capacity(), self._cursor + steps)
+        keys, values, states = old.keys, old.values, old.states
+        put = self._table.put
+        for i in range(self._cursor, end):
+            if states[i] == FULL:
+                put(keys[i], values[i])
+                states[i] = TOMBSTONE
+                old.live -= 1
+        self._cursor = end
+        if end == old.capacity():
+            self._old = None
+
+    def _rehash(self, capacity):
+        old = self._table
+        self._table = _Table(capacity)
+        put = self._table.put
+        keys, values, states = old.keys, old.values, old.states
+        for i in range(old.capacity()):
+            if states[i] == FULL:
+                put(keys[i], values[i])
+
+
+def _round_capacity(capacity):
+    """Return the smallest power of two that is at least capacity and MIN_CAPACITY."""
+    return max(MIN_CAPACITY, 1 << (max(capacity, 1) - 1).bit_length())
+
+
+if __name__ == "__main__":
+    m = IntHashMap()
+    m[10] = 100
+    m[20] = 200
+    m[-5] = 7
+    print("Get key 20:", m[20])
+    del m[20]
+    print("Get key 20 after removal:", m.get(20, -1))
+    assert len(m) == 2 and 10 in m and 20 not in m
+
+    import random
+    m = IntHashMap()
+    reference = {}
+    for step in range(20000):
+        key = random.randrange(-3000, 3000)
+        action = random.random()
+        if action < 0.6:
+            value = random.randrange(1 << 40)
+            m[key] = value
+            reference[key] = value
+        elif action < 0.9:
+            assert m.get(key) == reference.get(key)
+        elif key in reference:
+            del m[key]
+            del reference[key]
+        assert len(m) == len(reference)
+    assert dict(m.items()) == reference
+
+    bulk = IntHashMap()
+    bulk.update_from_arrays(array("q", range(0, 3000, 3)), array("q", range(1000)))
+    assert len(bulk) == 1000 and bulk[2997] == 999
+    print("All IntHashMap tests passed.")